@@ -21,6 +21,7 @@ Classes:
 from dataclasses import asdict, astuple, dataclass, field
 from functools import reduce
 from numbers import Real
+from operator import mul
 from typing import Any, Callable, Dict, List, Tuple, Union
 from uuid import uuid4
 
@@ -170,7 +171,7 @@ class Region(IOable):
     Returns:
       The magnitude size of the Region.
     """
-    return reduce(lambda x, y: x * y, self.lengths)
+    return reduce(mul, (d.length for d in self.factors))
 
 
   ### Methods: Syntactic sugar
@@ -414,8 +415,8 @@ class Region(IOable):
     assert all([isinstance(x, float) for x in point])
     assert self.dimension == len(point)
 
-    return all([d.contains(point[i], inc_lower, inc_upper) \
-                for i, d in enumerate(self.factors)])
+    return all(d.contains(x, inc_lower, inc_upper) \
+               for d, x in zip(self.factors, point))
 
 
   def encloses(self, that: 'Region', inc_lower = True, inc_upper = True
@@ -446,8 +447,8 @@ class Region(IOable):
     if self == that:
       return True
 
-    return all([d.encloses(that[i], inc_lower, inc_upper) \
-                for i, d in enumerate(self.factors)])
+    return all(d.encloses(t, inc_lower, inc_upper) \
+               for d, t in zip(self.factors, that.factors))
 
 
   def __contains__(self, value: Union['Region', List[float], str]) -> bool:
@@ -554,8 +555,8 @@ class Region(IOable):
     assert isinstance(that, Region)
     assert self.dimension == that.dimension
 
-    return all([d.is_intersecting(that[i])
-      for i, d in enumerate(self.factors)])
+    return all(d.is_intersecting(t)
+      for d, t in zip(self.factors, that.factors))
 
 
   def __eq__(self, that: 'Region') -> bool:
@@ -580,7 +581,7 @@ class Region(IOable):
     """
     return isinstance(that, Region) and \
            self.dimension == that.dimension and \
-           all([d == that[i] for i, d in enumerate(self.factors)])
+           all(d == t for d, t in zip(self.factors, that.factors))
 
 
   def get_intersection(self, that: 'Region', inc_bounds = False) -> 'Region':
@@ -32,6 +32,7 @@ class IOable(metaclass=ABCMeta):
   to_output, from_text and from_source methods. Requires the concrete
   classes to implement the to_object and from_object method.
   """
+  __slots__ = ()
 
   ### Methods: Serialization
 
@@ -66,10 +66,10 @@ class TEvent(Event[T]):
       True:   If the two Events equal.
       False:  Otherwise.
     """
-    return all([isinstance(that, TEvent),
-                self.when == that.when,
-                self.kind == that.kind,
-                self.context is that.context])
+    return isinstance(that, TEvent) and \
+           self.when == that.when and \
+           self.kind == that.kind and \
+           self.context is that.context
 
   def __lt__(self, that: 'TEvent[T]') -> bool:
     """
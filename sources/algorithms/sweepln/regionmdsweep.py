@@ -105,6 +105,8 @@ class RegionMdSweep(RegionSweep, MultidimenSweep[RegionGrp]):
       An iterator over all the pairs between the Region and
       currently active Regions, regardless of overlaps.
     """
-    for _, active in self.actives.items():
-      assert active[self.dimension].lower <= region[self.dimension].lower
+    d = self.dimension
+    lower = region._lower[d]
+    for active in self.actives.values():
+      assert active._lower[d] <= lower
       yield (active, region)
@@ -145,9 +145,11 @@ class RegionSweep(OneSweep[RegionGrp]):
       An iterator over all the pairs of overlaps between
       the Region and currently active Regions.
     """
-    for _, active in self.actives.items():
-      assert active[self.dimension].lower <= region[self.dimension].lower
-      if region.overlaps(active):
+    d, overlaps = self.dimension, region.overlaps
+    lower = region._lower[d]
+    for active in self.actives.values():
+      assert active._lower[d] <= lower
+      if overlaps(active):
         yield (active, region)
 
   ### Methods: Event Handlers
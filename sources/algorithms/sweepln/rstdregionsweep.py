@@ -109,9 +109,16 @@ class RestrictedRegionSweep(RegionSweep):
     assert event.kind == RegionSweepEvtKind.Begin or \
            event.kind == RegionSweepEvtKind.End
 
+    if self.region is None:
+      return True
+
     region, d = event.context, self.dimension
+    lower, upper = region.lower[d], region.upper[d]
+    rlower, rupper = self.region.lower[d], self.region.upper[d]
 
-    return self.region is None or self.region[d].overlaps(region[d])
+    # same as Interval.overlaps, along the sweep dimension
+    return (rlower < upper and lower < rupper) or \
+           (rlower == lower and rupper == upper)
 
   ### Methods: Event Handlers
 
@@ -13,15 +13,21 @@ Classes:
 """
 
 from collections import abc
-from dataclasses import asdict, astuple, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from random import shuffle
-from typing import Any, Dict, Iterable, Iterator, List, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union
 from uuid import uuid4
+from weakref import ref
+
+from numpy import array, asarray, concatenate, empty, lexsort, \
+                  ndarray as NDArray, ones, prod, triu
 
 from sources.abstract import IOable
-from sources.helpers import RandomFn, Randoms, to_base26
+from sources.helpers import DEBUG_INVARIANTS, PARALLEL_THRESHOLD, RandomFn, \
+                            Randoms, base26_sequence, to_base26_many
 
-from ..shapes import Interval, Region, RegionId, RegionPair
+from ..shapes import Interval, IntervalIndex, Region, RegionId, RegionPair
 from .regiontime import RegionEvtKind
 
 try: # cyclic codependency
@@ -51,7 +57,24 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     bounds:     The bounding Region that must enclose
                 all Regions in this collection.
                 Or None, for no outer bounding Region.
+    _by_id:     The index of Regions in this collection
+                by their unique identifiers.
+    _boxes:     The lower and upper bounding vertices of
+                the Regions in this collection, row by row,
+                packed together as a growable (N, 2, dimension)
+                array; exposed as the _lowers and _uppers views.
+    _nrows:     The number of filled rows in _boxes.
+    _stale:     Whether or not the rows in _boxes are out of
+                date, since a dimension of a Region in this
+                collection was reassigned.
+    _timeline:  The RegionTimeln instance binded to this
+                RegionSet, once created.
+    _index:     The IntervalIndex of the Regions' bounds along the first
+                dimension, for RegionSet.query, once created.
   """
+  __slots__ = ('id', 'dimension', 'bounds', 'regions', '_by_id',
+               '_boxes', '_nrows', '_stale', '_timeline', '_index', '__weakref__')
+
   id: str
   dimension: int
   bounds: Region
@@ -87,6 +110,10 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     self.dimension = dimension
     self.regions = []
     self.bounds = bounds
+    self._by_id = {}
+    self._boxes = empty((0, 2, dimension))
+    self._nrows = 0
+    self._stale = False
 
   ### Properties: Getters
 
@@ -108,6 +135,28 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
                      self.bounds == None or self.bounds.encloses(r)]) \
                 for r in self.regions])
 
+  @property
+  def _lowers(self) -> NDArray:
+    """
+    The lower bounding vertices of the Regions in this collection,
+    as a (N, dimension) view of the packed _boxes array.
+
+    Returns:
+      The view of the lower bounding vertices.
+    """
+    return self._boxes[:, 0]
+
+  @property
+  def _uppers(self) -> NDArray:
+    """
+    The upper bounding vertices of the Regions in this collection,
+    as a (N, dimension) view of the packed _boxes array.
+
+    Returns:
+      The view of the upper bounding vertices.
+    """
+    return self._boxes[:, 1]
+
   @property
   def length(self) -> int:
     """
@@ -124,18 +173,28 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     Computes the minimum Region that encloses all member
     Regions in this collection within it.
 
+    Reduces the lower and upper bounding vertices of all
+    Regions, as (N, dimension) arrays, with a minimum and a
+    maximum along each dimension; without constructing the
+    intermediate unions of the Regions.
+
     Returns:
       The minimum Region that encloses all Regions
       within this collection.
     """
-    assert self._instance_invariant
+    if DEBUG_INVARIANTS:
+      assert self._instance_invariant
     
     if len(self) == 0:
       return None
     if len(self) == 1:
       return self[0].copy()
 
-    return Region.from_union(self.regions)
+    lowers, uppers = self._bounds_arrays()
+    lower = lowers.min(axis=0)
+    upper = uppers.max(axis=0)
+
+    return Region(lower.tolist(), upper.tolist())
 
   @property
   def bbox(self) -> Region:
@@ -147,9 +206,24 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       The Region that encloses all Regions
       within this collection.
     """
-    assert self._instance_invariant
+    if DEBUG_INVARIANTS:
+      assert self._instance_invariant
     return self.minbounds if self.bounds == None else self.bounds
 
+  @property
+  def sizes(self) -> NDArray:
+    """
+    The magnitude sizes (length, area, volume) of all member Regions in
+    this collection, in the same order as the Regions. Computed at once by
+    multiplying the dimensional lengths (sides) of the lower and upper
+    bounding vertices arrays together.
+
+    Returns:
+      The length N array of the Regions' sizes.
+    """
+    lowers, uppers = self._bounds_arrays()
+    return prod(uppers - lowers, axis=1)
+
   @property
   def timeline(self) -> 'RegionTimeln':
     """
@@ -186,11 +260,7 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     """
     assert isinstance(id, str) and len(id) > 0
 
-    for region in self.regions:
-      if region.id == id:
-        return region
-
-    return None
+    return self._by_id.get(id)
 
   def __getitem__(self, index: Union[int,str]) -> Region:
     """
@@ -266,6 +336,135 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       assert self.bounds.encloses(region)
 
     self.regions.append(region)
+    self._by_id.setdefault(region.id, region)
+    region._add_owner(ref(self))
+
+    self._reserve(self._nrows + 1)
+    self._boxes[self._nrows] = region._lower, region._upper
+    self._nrows += 1
+
+  def extend(self, regions: List[Region], check: bool = True):
+    """
+    Append all of the given Regions to this collection of Regions at once.
+    The lower and upper bounding vertices of the given Regions are stacked
+    and copied into the packed _boxes array in a single step. If check,
+    validates the dimensionality and bounds of all given Regions together,
+    otherwise the given Regions are assumed to be valid; for example,
+    when generated within the bounds of this collection.
+
+    Args:
+      regions:  The list of Regions to be appended
+                to this collection of Regions.
+      check:    Whether or not to validate that the
+                Regions have the same dimensionality,
+                and are within the bounds.
+    """
+    if len(regions) == 0:
+      return
+    if check:
+      assert all([isinstance(region, Region) for region in regions])
+
+    boxes  = array([(region._lower, region._upper) for region in regions])
+    lowers = boxes[:, 0]
+    uppers = boxes[:, 1]
+
+    if check:
+      assert lowers.shape == uppers.shape == (len(regions), self.dimension)
+      if self.bounds != None:
+        assert (array(self.bounds.lower) <= lowers).all()
+        assert (uppers <= array(self.bounds.upper)).all()
+
+    self._append(regions, lowers, uppers)
+
+  def extend_bounds(self, lowers: NDArray, uppers: NDArray,
+                          ids: List[str] = None, check: bool = True):
+    """
+    Append new Regions, given by their lower and upper bounding vertices as
+    (N, dimension) arrays, to this collection of Regions at once. Unlike
+    RegionSet.extend, the bounding vertices are validated and copied into
+    the packed _boxes array directly from the given arrays; the
+    Regions are only constructed from the rows of the arrays.
+
+    Args:
+      lowers, uppers:
+        The (N, dimension) arrays of the lower and
+        upper bounding vertices of the new Regions.
+      ids:
+        The list of N unique identifiers for the
+        new Regions, or None to generate them.
+      check:
+        Whether or not to validate that the
+        Regions have the same dimensionality,
+        and are within the bounds.
+    """
+    lowers, uppers = asarray(lowers, dtype=float), asarray(uppers, dtype=float)
+    if ids is None:
+      ids = [''] * len(lowers)
+
+    if check:
+      assert lowers.shape == uppers.shape == (len(ids), self.dimension)
+      assert (lowers <= uppers).all()
+      if self.bounds != None:
+        assert (array(self.bounds.lower) <= lowers).all()
+        assert (uppers <= array(self.bounds.upper)).all()
+
+    if len(ids) == 0:
+      return
+
+    regions = [Region(lower, upper, rid) for rid, lower, upper
+               in zip(ids, lowers.tolist(), uppers.tolist())]
+
+    self._append(regions, lowers, uppers)
+
+  def _append(self, regions: List[Region], lowers: NDArray, uppers: NDArray):
+    """
+    Append the given, already validated, Regions to this collection of
+    Regions, and copy their lower and upper bounding vertices into the
+    packed _boxes array, growing it if needed.
+
+    Args:
+      regions:  The list of Regions to be appended
+                to this collection of Regions.
+      lowers, uppers:
+                The (N, dimension) arrays of the lower and
+                upper bounding vertices of the Regions.
+    """
+    self.regions.extend(regions)
+    owner = ref(self)
+    for region in regions:
+      self._by_id.setdefault(region.id, region)
+      region._add_owner(owner)
+
+    nrows = self._nrows + len(regions)
+    self._reserve(nrows)
+    self._boxes[self._nrows:nrows, 0] = lowers
+    self._boxes[self._nrows:nrows, 1] = uppers
+    self._nrows = nrows
+
+  def _invalidate(self):
+    """
+    Mark the rows of the packed _boxes array as out of date, to be refilled
+    from the Regions on the next access. Called by the Regions in this
+    collection when one of their dimensions is reassigned.
+    """
+    self._stale = True
+
+  def _reserve(self, nrows: int):
+    """
+    Ensure that the packed _boxes array has the capacity for at least
+    the given number of rows. Grows geometrically, at least doubling
+    the capacity, and copies over the existing rows.
+
+    Args:
+      nrows:  The number of rows required.
+    """
+    if nrows <= len(self._boxes):
+      return
+
+    capacity = max(2*len(self._boxes), nrows, 8)
+    buffer = empty((capacity, 2, self.dimension))
+    buffer[0:self._nrows] = self._boxes[0:self._nrows]
+    self._boxes = buffer
 
   def streamadd(self, regions: Iterable[Region]):
     """
@@ -277,8 +476,7 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       regions:  The Iterable of Regions to be appended
                 to this collection of Regions.
     """
-    for region in regions:
-      self.add(region)
+    self.extend(list(regions))
 
   ### Methods: Clone
 
@@ -294,6 +492,15 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     bounds  = self.bounds.copy() if self.bounds else None
     regions = RegionSet(bounds=bounds, dimension=self.dimension)
     regions.regions = self.regions.copy()
+    regions._by_id = self._by_id.copy()
+    regions._boxes = self._boxes.copy()
+    regions._nrows = self._nrows
+    regions._stale = self._stale
+
+    owner = ref(regions)
+    for region in regions.regions:
+      region._add_owner(owner)
+
     return regions
 
   def copy(self) -> 'RegionSet':
@@ -351,7 +558,8 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
   def shuffle(self, random: RandomFn = Randoms.uniform()) -> 'RegionSet':
     """
     Clone this collection of Regions and returns the
-    copied and shuffled collection of Regions.
+    copied and shuffled collection of Regions. The rows of
+    the packed _boxes array are permuted along with the Regions.
 
     Args:
       random:   The random number generator.
@@ -360,8 +568,14 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       The newly, constructed shuffled copy of
       this collection of the Regions.
     """
+    order = list(range(len(self)))
+    shuffle(order, random=random)
+
     regions = self.copy()
-    shuffle(regions.regions, random=random)
+    regions.regions = [self.regions[k] for k in order]
+    if regions._nrows == len(regions):
+      regions._boxes[0:regions._nrows] = self._boxes[order]
+
     return regions
 
   ### Methods: Queries
@@ -386,8 +600,8 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       value in self
 
     Overload Method that wraps:
-      value in self.regions, when value is a str.
-      value.id in self.regions, when value is a Region.
+      value in self._by_id, when value is a str.
+      value.id in self._by_id, when value is a Region.
 
     Args:
       value:
@@ -398,8 +612,39 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       True:   If Region exists within this RegionSet.
       False:  Otherwise.
     """
-    return self.get(value.id if isinstance(value, Region) \
-                             else value) != None
+    return (value.id if isinstance(value, Region) \
+                     else value) in self._by_id
+
+  def query(self, region: Region) -> List[Region]:
+    """
+    Find all of the Regions within this set that overlap with the given
+    Region, with the same semantics as Region.overlaps, without testing
+    every Region in this set. The bounds of the Regions along the first
+    dimension are indexed with an IntervalIndex; thus, the candidate Regions
+    are found with two binary searches and only the candidates are tested
+    for overlaps along all dimensions. The index is built on the first
+    query, and rebuilt after Regions are added or changed.
+
+    Args:
+      region:
+        The Region to find the overlapping
+        Regions within this set with.
+
+    Returns:
+      The list of Regions within this set that overlap
+      with the given Region, in the order of this set.
+    """
+    assert isinstance(region, Region)
+    assert region.dimension == self.dimension
+
+    lowers, uppers = self._bounds_arrays()
+    if getattr(self, '_index', None) is None or len(self._index) != len(lowers):
+      self._index = IntervalIndex.from_bounds(lowers[:, 0], uppers[:, 0])
+
+    candidates = self._index.overlapping_order(region._lower[0], region._upper[0])
+    matches = candidates[region.overlaps_many(lowers[candidates], uppers[candidates])]
+
+    return [self.regions[k] for k in sorted(matches.tolist())]
 
   def overlaps(self, dimension: int = 0) -> List[RegionPair]:
     """
@@ -423,17 +668,250 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       if event.kind == RegionEvtKind.Begin:
         ordered_regions.append(event.context)
 
+    lowers = [region.lower[dimension] for region in ordered_regions]
+
     overlaps = []
-    for first in ordered_regions:
-      for second in ordered_regions:
+    for i, first in enumerate(ordered_regions):
+      for j, second in enumerate(ordered_regions):
         if first is second: continue
-        if first[dimension].lower > second[dimension].lower: continue
+        if lowers[i] > lowers[j]: continue
         if (second, first) in overlaps: continue
         if first.overlaps(second):
           overlaps.append((first, second))
 
     return overlaps
 
+  def overlap_matrix(self, that: 'RegionSet' = None, tilesize: int = 1024,
+                           threads: int = 1, dtype: type = float) -> NDArray:
+    """
+    Compute whether or not each Region within this set overlaps with each
+    Region within the given RegionSet, or within this set if not given.
+    Vectorized over the lower and upper bounding vertices of all Regions,
+    as (N, dimension) arrays, with the same semantics as Region.overlaps:
+    along each dimension, the Intervals overlap if they are equal or if each
+    Interval's lower bound is less than the other Interval's upper bound
+    (adjacent Intervals do not overlap). Computed in square tiles of
+    Regions, to bound the size of the intermediate arrays. The tiles are
+    independent, so they can be computed by multiple threads.
+
+    Args:
+      that:
+        The other RegionSet to test for overlaps
+        with this RegionSet. Defaults to this
+        RegionSet itself.
+      tilesize:
+        The number of Regions per side of
+        each tile computed at a time.
+      threads:
+        The number of worker threads.
+      dtype:
+        The floating point type the bounding vertices
+        are compared in; float32 halves the memory
+        traffic, but only where the precision of the
+        bounding values permits it.
+
+    Returns:
+      The (len(self), len(that)) boolean matrix,
+      where [i, j] is True if the i-th Region in this
+      set overlaps with the j-th Region in that set.
+    """
+    if that is None:
+      that = self
+
+    assert isinstance(that, RegionSet)
+    assert self.dimension == that.dimension
+    assert tilesize > 0
+
+    lo1, hi1 = self._bounds_arrays(dtype)
+    lo2, hi2 = that._bounds_arrays(dtype)
+
+    overlaps = empty((len(lo1), len(lo2)), dtype=bool)
+
+    def fill(i: int, j: int):
+      overlaps[i:i+tilesize, j:j+tilesize] = \
+        self._overlap_tile(lo1[i:i+tilesize], hi1[i:i+tilesize],
+                           lo2[j:j+tilesize], hi2[j:j+tilesize])
+
+    self._map_tiles(fill, [(i, j) for i in range(0, len(lo1), tilesize)
+                                  for j in range(0, len(lo2), tilesize)], threads)
+
+    return overlaps
+
+  def pairwise_overlaps(self, tilesize: int = 1024, threads: int = 1,
+                              dtype: type = float) -> NDArray:
+    """
+    Compute whether or not each pair of Regions within this set overlap.
+    Equivalent to overlap_matrix() of this set with itself, but since
+    overlaps are symmetric, only computes the tiles on and above the
+    diagonal, and mirrors them into the tiles below the diagonal.
+
+    Args:
+      tilesize:
+        The number of Regions per side of
+        each tile computed at a time.
+      threads:
+        The number of worker threads.
+      dtype:
+        The floating point type the bounding vertices
+        are compared in; float32 halves the memory
+        traffic, but only where the precision of the
+        bounding values permits it.
+
+    Returns:
+      The (len(self), len(self)) symmetric boolean
+      matrix, where [i, j] is True if the i-th and
+      j-th Regions in this set overlap.
+    """
+    assert tilesize > 0
+
+    lowers, uppers = self._bounds_arrays(dtype)
+
+    overlaps = empty((len(lowers), len(lowers)), dtype=bool)
+
+    def fill(i: int, j: int):
+      tile = self._overlap_tile(lowers[i:i+tilesize], uppers[i:i+tilesize],
+                                lowers[j:j+tilesize], uppers[j:j+tilesize])
+      overlaps[i:i+tilesize, j:j+tilesize] = tile
+      overlaps[j:j+tilesize, i:i+tilesize] = tile.T
+
+    self._map_tiles(fill, [(i, j) for i in range(0, len(lowers), tilesize)
+                                  for j in range(i, len(lowers), tilesize)], threads)
+
+    return overlaps
+
+  def overlap_pairs(self, tilesize: int = 1024, threads: int = 1,
+                          dtype: type = float) -> NDArray:
+    """
+    Compute the pairs of Regions within this set that overlap, as indices
+    into this set's Regions. Same tiles as pairwise_overlaps(), only on and
+    above the diagonal, but only keeps the overlapping pairs of each tile,
+    rather than the full (len(self), len(self)) matrix.
+
+    Args:
+      tilesize:
+        The number of Regions per side of
+        each tile computed at a time.
+      threads:
+        The number of worker threads.
+      dtype:
+        The floating point type the bounding vertices
+        are compared in; float32 halves the memory
+        traffic, but only where the precision of the
+        bounding values permits it.
+
+    Returns:
+      The (K, 2) integer array of the K overlapping
+      pairs of indices [i, j], where i < j, sorted by
+      i and then by j.
+    """
+    assert tilesize > 0
+
+    lowers, uppers = self._bounds_arrays(dtype)
+
+    pairs = {}
+
+    def fill(i: int, j: int):
+      tile = self._overlap_tile(lowers[i:i+tilesize], uppers[i:i+tilesize],
+                                lowers[j:j+tilesize], uppers[j:j+tilesize])
+      if i == j:
+        tile = triu(tile, 1)
+      pairs[(i, j)] = tile.nonzero()
+
+    self._map_tiles(fill, [(i, j) for i in range(0, len(lowers), tilesize)
+                                  for j in range(i, len(lowers), tilesize)], threads)
+
+    if len(pairs) == 0:
+      return empty((0, 2), dtype=int)
+
+    first  = concatenate([rows + i for (i, _), (rows, _) in pairs.items()])
+    second = concatenate([cols + j for (_, j), (_, cols) in pairs.items()])
+    order  = lexsort((second, first))
+
+    return array([first[order], second[order]]).T
+
+  @staticmethod
+  def _map_tiles(fill: Callable[[int, int], None],
+                 tiles: List[Tuple[int, int]], threads: int = 1):
+    """
+    Compute each of the given tiles of an overlap matrix, with the given
+    function, either sequentially or with a pool of worker threads. Each tile
+    writes to its own disjoint slices of the output matrix, and NumPy
+    releases the GIL while comparing the arrays, so the tiles are computed
+    concurrently.
+
+    Args:
+      fill:     The function that computes and writes the
+                tile at the given row and column offsets.
+      tiles:    The list of row and column offsets of
+                the tiles to be computed.
+      threads:  The number of worker threads.
+    """
+    assert isinstance(threads, int) and threads > 0
+
+    if threads == 1 or len(tiles) <= 1:
+      for i, j in tiles:
+        fill(i, j)
+      return
+
+    with ThreadPoolExecutor(threads) as executor:
+      for job in [executor.submit(fill, i, j) for i, j in tiles]:
+        job.result()
+
+  @staticmethod
+  def _overlap_tile(lo1: NDArray, hi1: NDArray, lo2: NDArray, hi2: NDArray) -> NDArray:
+    """
+    Compute whether or not each Region, given by the first pair of lower and
+    upper bounding vertices arrays, overlaps with each Region, given by the
+    second pair of arrays. Broadcasts one dimension at a time, such that the
+    intermediate arrays are at most (len(lo1), len(lo2)).
+
+    Args:
+      lo1, hi1: The (N, dimension) lower and upper
+                bounding vertices of the first Regions.
+      lo2, hi2: The (M, dimension) lower and upper
+                bounding vertices of the second Regions.
+
+    Returns:
+      The (N, M) boolean overlap matrix.
+    """
+    overlaps = ones((len(lo1), len(lo2)), dtype=bool)
+    for d in range(lo1.shape[1]):
+      l1, h1 = lo1[:, d, None], hi1[:, d, None]
+      l2, h2 = lo2[None, :, d], hi2[None, :, d]
+      overlaps &= ((l1 < h2) & (l2 < h1)) | ((l1 == l2) & (h1 == h2))
+
+    return overlaps
+
+  def _bounds_arrays(self, dtype: type = float) -> Tuple[NDArray, NDArray]:
+    """
+    The lower and upper bounding vertices of all Regions within this set,
+    as (N, dimension) arrays. Views of the packed _boxes array, refilled
+    from the Regions first, if the Regions in this collection were not all
+    added through RegionSet.add, or if any of their dimensions were
+    reassigned since the rows were filled (see RegionSet._invalidate).
+    Converted to the given floating point type, if not float.
+
+    Args:
+      dtype:  The floating point type of the arrays.
+
+    Returns:
+      The pair of lower and upper bounding vertices arrays.
+    """
+    if self._nrows != len(self) or self._stale:
+      lowers = array([r._lower for r in self.regions]).reshape(-1, self.dimension)
+      uppers = array([r._upper for r in self.regions]).reshape(-1, self.dimension)
+      self._nrows = 0
+      self._reserve(len(self))
+      self._boxes[0:len(self), 0] = lowers
+      self._boxes[0:len(self), 1] = uppers
+      self._nrows = len(self)
+      self._stale = False
+      self._index = None
+
+    lowers, uppers = self._lowers[0:self._nrows], self._uppers[0:self._nrows]
+
+    return lowers.astype(dtype, copy=False), uppers.astype(dtype, copy=False)
+
   def intersect(self, dimension: int = 0) -> List[Region]:
     """
     List all of intersecting Regions between pairwise Regions within this set.
@@ -542,11 +1020,18 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
   @classmethod
   def from_random(cls, nregions: int, bounds: Region,
                        id: str = '', base26_ids: bool = True,
+                       seed: int = None, parallel: bool = False,
                        **kwargs) -> 'RegionSet':
     """
     Construct a new RegionSet with N randomly generated Regions. All randomly
     generated Regions must be enclosed by the given bounding Region. All
     subregions must have the same number of dimensions as the bounding Region.
+    If a seed is given, the default random number generators for both the
+    positions and the sizes draw from a single, shared seeded random number
+    generator; thus, the generated RegionSet is reproducible. Otherwise, if
+    parallel, for more than PARALLEL_THRESHOLD Regions, the default random
+    number generators draw samples with multiple threads, from independent
+    streams that are not reproducible with numpy.random.seed.
 
     Args:
       nregions:   The number of Regions to be generated.
@@ -556,6 +1041,10 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       base26_ids: Whether or not the randonly generated
                   Regions will be assign numeric IDs,
                   encoded in Base26 (A - Z).
+      seed:       The seed for the shared random number
+                  generator, or None for the defaults.
+      parallel:   Whether or not to draw large samples
+                  with multiple threads, if no seed.
       kwargs:     Additional arguments passed through to
                   Region.from_intervals.
 
@@ -564,13 +1053,64 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     """
     assert isinstance(nregions, int) and nregions > 0
 
+    if seed != None:
+      randomng = Randoms.seeded(seed).uniform()
+      for rng in ['posnrng', 'sizerng']:
+        kwargs.setdefault(rng, randomng)
+    elif parallel and nregions > PARALLEL_THRESHOLD:
+      for rng in ['posnrng', 'sizerng']:
+        kwargs.setdefault(rng, Randoms.uniform(parallel=True))
+
     regionset = cls(id, bounds)
     regions = bounds.random_regions(nregions, **kwargs)
-    for n, region in enumerate(regions):
-      if base26_ids:
-        region.id = to_base26(n + 1)
-      regionset.add(region)
+    if base26_ids:
+      for region, rid in zip(regions, base26_sequence()):
+        region.id = rid
+    regionset.extend(regions)
+
+    return regionset
+
+  @classmethod
+  def generate(cls, nregions: int, bounds: Region,
+                    randomng: RandomFn = Randoms.uniform(),
+                    id: str = '', base26_ids: bool = True,
+                    out: NDArray = None) -> 'RegionSet':
+    """
+    Construct a new RegionSet with N randomly generated Regions, enclosed by
+    the given bounding Region. Unlike RegionSet.from_random, the lower and
+    upper bounding values of all Regions are drawn in bulk from a single call
+    to the given random number generator, then sorted so that lower <= upper;
+    thus, the Regions sizes are not controlled, only their distribution.
+    If out is given, the bounding values are drawn into that preallocated
+    (N, dimension, 2) array, which can be reused across repeated generation
+    to avoid reallocating the samples each time.
+
+    Args:
+      nregions:   The number of Regions to be generated.
+      bounds:     The bounding Region that all randomly
+                  generated Regions must be enclosed by.
+      randomng:   The random number generator that dictates
+                  the distribution of the bounding values.
+      id:         The unique identifier for this RegionSet.
+      base26_ids: Whether or not the randonly generated
+                  Regions will be assign numeric IDs,
+                  encoded in Base26 (A - Z).
+      out:        The preallocated (N, dimension, 2) array
+                  of float64 for the bounding values.
+
+    Returns:
+      The newly generated RegionSet.
+    """
+    assert isinstance(nregions, int) and nregions > 0
+    assert isinstance(bounds, Region)
+
+    regionset = cls(id, bounds)
+    samples = Randoms.batch_intervals(nregions, bounds.dimension,
+                                      bounds.lower, bounds.upper, randomng, out)
+
+    ids = to_base26_many(range(1, nregions + 1)) if base26_ids else [''] * nregions
 
+    regionset.extend_bounds(samples[:, :, 0], samples[:, :, 1], ids, check=False)
     return regionset
 
   @classmethod
@@ -629,7 +1169,8 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     if 'compact' in kwargs and kwargs['compact']:
       return dict(map(lambda f: (f, getattr(object, f)), fieldnames))
     else:
-      return asdict(object)
+      fieldnames = ['id', 'dimension', 'bounds', 'regions']
+      return dict(map(lambda f: (f, Region._asdict(getattr(object, f))), fieldnames))
 
   @classmethod
   def from_dict(cls, object: Dict, id: str = '', refset: 'RegionSet' = None) -> 'RegionSet':
@@ -102,12 +102,14 @@ class RegionEvent(MdTEvent[Region]):
     self.context = context
     self.dimension = dimension
 
+    lower, upper = context._lower[dimension], context._upper[dimension]
+
     if kind == RegionEvtKind.Init or kind == RegionEvtKind.Begin:
-      self.when = context[dimension].lower
+      self.when = lower
     if kind == RegionEvtKind.Done or kind == RegionEvtKind.End:
-      self.when = context[dimension].upper
+      self.when = upper
 
-    self.order = (0 if context[dimension].length == 0 else 1) * \
+    self.order = (0 if lower == upper else 1) * \
                  (-1 if kind == RegionEvtKind.End else 1)
 
     if kind == RegionEvtKind.Init:
@@ -133,10 +135,10 @@ class RegionEvent(MdTEvent[Region]):
       True:   If the two RegionEvents equal.
       False:  Otherwise.
     """
-    return all([isinstance(that, RegionEvent),
-                self.when == that.when,
-                self.kind == that.kind,
-                self.context is that.context])
+    return isinstance(that, RegionEvent) and \
+           self.when == that.when and \
+           self.kind == that.kind and \
+           self.context is that.context
 
   def __lt__(self, that: 'RegionEvent') -> bool:
     """
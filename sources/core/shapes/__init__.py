@@ -1,4 +1,5 @@
 #!/usr/bin/env python
 
 from .interval import *
+from .intervalindex import *
 from .region import *
@@ -21,10 +21,10 @@ from functools import reduce
 from numbers import Number, Real
 from typing import Any, Callable, Dict, List, Tuple, Union
 
-from numpy import floor
+from numpy import around, asarray, maximum, minimum, where
 
 from sources.abstract import IOable
-from sources.helpers import NDArray, RandomFn, Randoms
+from sources.helpers import DEBUG_INVARIANTS, NDArray, RandomFn, Randoms
 
 
 @dataclass(order = True)
@@ -46,7 +46,18 @@ class Interval(IOable, abc.Container, abc.Hashable):
   Attributes:
     lower, upper:
       The lower and upper bounding values.
+    length:
+      The distance between the lower and
+      upper bounding values.
+    midpoint:
+      The value equal distance between the
+      lower and upper bounding values.
+    _frozen:
+      Whether or not assign() is disallowed,
+      once set by freeze().
   """
+  __slots__ = ('lower', 'upper', 'length', 'midpoint', '_frozen')
+
   lower: float
   upper: float
 
@@ -55,13 +66,24 @@ class Interval(IOable, abc.Container, abc.Hashable):
     Initialize a new Interval, with the lower and upper bounding values.
     Converts input values to floating point numbers, and assigns
     the float value to the lower and upper fields. If lower is greater
-    than upper, swaps the lower and upper values.
+    than upper, swaps the lower and upper values. Precomputes the length
+    and midpoint of this Interval.
 
     Args:
       lower, upper:
         the lower and upper bounding values.
     """
-    self.assign(float(lower), float(upper))
+    lower, upper = float(lower), float(upper)
+    if lower > upper:
+      lower, upper = upper, lower
+
+    object.__setattr__(self, 'lower', lower)
+    object.__setattr__(self, 'upper', upper)
+    object.__setattr__(self, 'length', upper - lower)
+    object.__setattr__(self, 'midpoint', (lower + upper) / 2)
+
+    if DEBUG_INVARIANTS:
+      assert self._instance_invariant
 
   ### Properties: Getters
 
@@ -72,36 +94,18 @@ class Interval(IOable, abc.Container, abc.Hashable):
     - lower, upper must Real or float values
     - lower <= upper
 
+    Enforced on construction and by assign(), and the
+    bounding values cannot otherwise be set, so it is not
+    rechecked by the query methods. Rechecked on
+    construction only if DEBUG_INVARIANTS is set.
+
     Returns:
       True: If instance invariant holds
       False: Otherwise.
     """
-    return all([isinstance(self.lower, Real),
-                isinstance(self.upper, Real),
-                self.lower <= self.upper])
-
-  @property
-  def length(self) -> float:
-    """
-    Compute the length of this Interval.
-
-    Returns:
-      The distance between the lower and
-      upper bounding values.
-    """
-    return abs(self.upper - self.lower)
-
-  @property
-  def midpoint(self) -> float:
-    """
-    Compute the midpoint between the lower and upper bounds
-    of this Interval.
-
-    Returns:
-      The value equal distance between the lower and
-      upper bounding values.
-    """
-    return (self.lower + self.upper) / 2
+    return isinstance(self.lower, Real) and \
+           isinstance(self.upper, Real) and \
+           self.lower <= self.upper
 
   ### Methods: Assignment
 
@@ -114,19 +118,20 @@ class Interval(IOable, abc.Container, abc.Hashable):
     Ensures that the lower and upper bounding values satisfy the object
     invariant: lower <= upper, the lower and upper bounding values cannot be
     modified directly after this Interval is initialized. If the lower or upper
-    bounding values are attempted to be set, raises an exception. This
-    effectively prevents this Interval from being mutated into an invalid state.
-    To mutate this Interval, call the assign() method with both lower and
-    upper bounding values instead.
+    bounding values, or the derived length or midpoint, are attempted to be
+    set, raises an exception. This effectively prevents this Interval from
+    being mutated into an invalid state. To mutate this Interval, call the
+    assign() method with both lower and upper bounding values instead.
 
     Args:
       name:   The attribute name
       value:  The value to be assigned to it.
 
     Raises:
-      Exception: Attempt to be set lower or upper
+      Exception: Attempt to be set lower, upper,
+                 length or midpoint
     """
-    if name == 'lower' or name == 'upper':
+    if name in Interval.__slots__:
       raise Exception(f'Cannot set immutable "{name}" attribute')
 
     object.__setattr__(self, name, value)
@@ -136,21 +141,42 @@ class Interval(IOable, abc.Container, abc.Hashable):
     Assign the lower and upper bounding values of this Interval.
     Converts input values to floating point numbers, and assigns
     the float value to the lower and upper fields. If lower is greater
-    than upper, swaps the lower and upper values.
+    than upper, swaps the lower and upper values. Recomputes the length
+    and midpoint of this Interval.
 
     Args:
       lower, upper:
         the lower and upper bounding values.
+
+    Raises:
+      Exception: This Interval is frozen.
     """
+    if getattr(self, '_frozen', False):
+      raise Exception('Cannot assign a frozen Interval')
+
     assert isinstance(lower, Real)
     assert isinstance(upper, Real)
 
+    lower, upper = float(lower), float(upper)
     if lower > upper:
-      object.__setattr__(self, 'lower', float(upper))
-      object.__setattr__(self, 'upper', float(lower))
-    else:
-      object.__setattr__(self, 'lower', float(lower))
-      object.__setattr__(self, 'upper', float(upper))
+      lower, upper = upper, lower
+
+    object.__setattr__(self, 'lower', lower)
+    object.__setattr__(self, 'upper', upper)
+    object.__setattr__(self, 'length', upper - lower)
+    object.__setattr__(self, 'midpoint', (lower + upper) / 2)
+
+  def freeze(self) -> 'Interval':
+    """
+    Disallow any further assign() to this Interval; thus, this Interval
+    becomes immutable. Used for the dimensions of a Region, which caches
+    its bounding values. Copies of a frozen Interval are not frozen.
+
+    Returns:
+      This Interval.
+    """
+    object.__setattr__(self, '_frozen', True)
+    return self
 
   ### Methods: Hash
 
@@ -163,10 +189,21 @@ class Interval(IOable, abc.Container, abc.Hashable):
     Returns:
       The hash value for this object.
     """
-    return hash(astuple(self))
+    return hash((self.lower, self.upper))
 
   ### Methods: Clone
 
+  def __reduce__(self) -> Tuple[type, Tuple[float, float]]:
+    """
+    Return the constructor and arguments to recreate this Interval, for
+    pickle and copy. Required since the lower and upper bounding values
+    are slots that cannot be restored by attribute assignment.
+
+    Returns:
+      The class and the lower and upper bounding values.
+    """
+    return (self.__class__, (self.lower, self.upper))
+
   def __copy__(self) -> 'Interval':
     """
     Create a shallow copy of this Interval and return it.
@@ -174,7 +211,7 @@ class Interval(IOable, abc.Container, abc.Hashable):
     Returns:
       The newly created Interval copy.
     """
-    return Interval(*astuple(self))
+    return Interval(self.lower, self.upper)
 
   def copy(self) -> 'Interval':
     """
@@ -211,8 +248,6 @@ class Interval(IOable, abc.Container, abc.Hashable):
               upper bounding values.
       False:  Otherwise.
     """
-    assert self._instance_invariant
-
     gte_lower = self.lower <= value if inc_lower else self.lower < value
     lte_upper = self.upper >= value if inc_upper else self.upper > value
 
@@ -241,9 +276,15 @@ class Interval(IOable, abc.Container, abc.Hashable):
     """
     assert isinstance(that, Interval)
 
-    return all([self.length >= that.length,
-                self.contains(that.lower, inc_lower, inc_upper),
-                self.contains(that.upper, inc_lower, inc_upper)])
+    # since lower <= upper for both, implies that.length <= self.length and
+    # the remaining bounds checks of self.contains(that.lower / that.upper)
+    if inc_lower:
+      if that.lower < self.lower: return False
+    elif that.lower <= self.lower: return False
+
+    if inc_upper:
+      return that.upper <= self.upper
+    return that.upper < self.upper
 
   def __contains__(self, value: Union[float, 'Interval']) -> bool:
     """
@@ -269,7 +310,11 @@ class Interval(IOable, abc.Container, abc.Hashable):
               within this Interval's bounds.
       False:  Otherwise.
     """
-    if isinstance(value, Interval):
+    # exact type checks first, to bypass ABCMeta.__instancecheck__
+    kind = type(value)
+    if kind is float or kind is int:
+      return self.lower <= value <= self.upper
+    elif kind is Interval or isinstance(value, Interval):
       return self.encloses(value)
     else:
       return self.contains(value)
@@ -313,16 +358,10 @@ class Interval(IOable, abc.Container, abc.Hashable):
       - |<- Interval B ->|   |<- Interval A ->|
     """
     assert isinstance(that, Interval)
-    assert self._instance_invariant
-    assert that._instance_invariant
-
-    if self == that:
-      return True
-    if self.upper <= that.lower or that.upper <= self.lower:
-      return False
 
-    # return any([that.lower in self, that.upper in self, self.lower in that, self.upper in that])
-    return max(self.lower, that.lower) <= min(self.upper, that.upper)
+    # neither separated nor adjacent, or equal (zero-length) Intervals
+    return (self.lower < that.upper and that.lower < self.upper) or \
+           (self.lower == that.lower and self.upper == that.upper)
 
   ### Methods: Generators
 
@@ -359,15 +398,39 @@ class Interval(IOable, abc.Container, abc.Hashable):
         |<- Interval B ->|
               |<- #### ->|
     """
+    bounds = self.overlap_bounds(that)
+    if bounds is None:
+      return None
+
+    return Interval(*bounds)
+
+  def overlap_bounds(self, that: 'Interval') -> Union[Tuple[float, float], None]:
+    """
+    Compute the lower and upper bounding values of the overlapping Interval
+    between this Interval and that Interval, without constructing it. Same
+    semantics as overlaps() and intersect(). Return the bounding values as a
+    tuple, or None if the Intervals do not overlap.
+
+    Args:
+      that:
+        The other Interval which this Interval is to compute
+        the overlapping bounding values with.
+
+    Returns:
+      The (lower, upper) overlapping bounding
+      values: If the Intervals overlap.
+      None: If the Intervals do not overlap.
+    """
     assert isinstance(that, Interval)
-    assert self._instance_invariant
-    assert that._instance_invariant
 
-    if not self.overlaps(that):
+    if (self.upper <= that.lower or that.upper <= self.lower) and \
+       (self.lower != that.lower or self.upper != that.upper):
       return None
 
-    return Interval(max(self.lower, that.lower),
-                    min(self.upper, that.upper))
+    lower = self.lower if self.lower > that.lower else that.lower
+    upper = self.upper if self.upper < that.upper else that.upper
+
+    return (lower, upper)
 
   def union(self, that: 'Interval') -> 'Interval':
     """
@@ -398,8 +461,6 @@ class Interval(IOable, abc.Container, abc.Hashable):
         |<- ############## ->|    |<- ############## ->|
     """
     assert isinstance(that, Interval)
-    assert self._instance_invariant
-    assert that._instance_invariant
 
     return Interval(min(self.lower, that.lower),
                     max(self.upper, that.upper))
@@ -431,6 +492,54 @@ class Interval(IOable, abc.Container, abc.Hashable):
 
     return randomng(nvalues, self.lower, self.upper)
 
+  def random_bounds(self, nintervals: int = 1, sizepc: 'Interval' = None,
+                          posnrng: RandomFn = Randoms.uniform(),
+                          sizerng: RandomFn = Randoms.uniform(),
+                          precision: int = None) -> Tuple[NDArray, NDArray]:
+    """
+    Randomly generate the lower and upper bounding values of N Intervals
+    within this Interval, as arrays, without constructing the Intervals.
+    Same parameters and distribution as random_intervals(), but computed for
+    all N Intervals at once, vectorized over the arrays of random positions
+    and sizes.
+
+    Args:
+      nintervals: The number of Intervals to be generated.
+      sizepc:     The size range as a percentage of the
+                  total Interval length.
+      posnrng:    The random number generator for choosing
+                  the position of the Interval.
+      sizerng:    The random number generator for choosing
+                  the size of the Interval.
+      precision:  The number of digits after the decimal
+                  point for the lower and upper bounding
+                  values, or None for arbitrary precision.
+
+    Returns:
+      The pair of arrays of the lower and upper bounding
+      values of the randonly generated Intervals.
+    """
+    if sizepc == None:
+      sizepc = _UNIT
+    if precision != None:
+      assert isinstance(precision, int)
+
+    assert isinstance(sizepc, Interval) and _UNIT.encloses(sizepc)
+    assert isinstance(posnrng, Callable) and isinstance(sizerng, Callable)
+
+    positions = asarray(self.random_values(nintervals, posnrng), dtype=float)
+    lengths   = asarray(sizepc.random_values(nintervals, sizerng), dtype=float) * self.length
+
+    lowers = where(positions <= self.midpoint, positions,
+                   maximum(positions - lengths, self.lower))
+    uppers = minimum(lowers + lengths, self.upper)
+
+    if precision != None:
+      around(lowers, precision, out=lowers)
+      around(uppers, precision, out=uppers)
+
+    return lowers, uppers
+
   def random_intervals(self, nintervals: int = 1, sizepc: 'Interval' = None,
                              posnrng: RandomFn = Randoms.uniform(),
                              sizerng: RandomFn = Randoms.uniform(),
@@ -446,7 +555,7 @@ class Interval(IOable, abc.Container, abc.Hashable):
     where the lower and upper bounding values are rounded/truncated to the
     specified precision (number of digits after the decimal point).
     If precision is None, the lower and upper bounding values are of
-    arbitrary precision.
+    arbitrary precision. The bounding values are generated by random_bounds().
 
     Args:
       nintervals: The number of Intervals to be generated.
@@ -464,29 +573,9 @@ class Interval(IOable, abc.Container, abc.Hashable):
       List of randonly generated Intervals
       within this Interval.
     """
-    if sizepc == None:
-      sizepc = Interval(0, 1)
-    if precision != None:
-      assert isinstance(precision, int)
+    lowers, uppers = self.random_bounds(nintervals, sizepc, posnrng, sizerng, precision)
 
-    assert isinstance(sizepc, Interval) and Interval(0, 1).encloses(sizepc)
-    assert isinstance(posnrng, Callable) and isinstance(sizerng, Callable)
-
-    intervals = []
-    positions = self.random_values(nintervals, posnrng)
-    lengths   = [s * self.length for s in sizepc.random_values(nintervals, sizerng)]
-
-    for i in range(nintervals):
-      length = lengths[i]
-      position = positions[i]
-      lower = position if position <= self.midpoint else max(position - length, self.lower)
-      upper = min(lower + length, self.upper)
-      if precision != None:
-        lower = round(lower, precision)
-        upper = round(upper, precision)
-      intervals.append(Interval(lower, upper))
-
-    return intervals
+    return [Interval(l, u) for l, u in zip(lowers.tolist(), uppers.tolist())]
 
   ### Class Methods: Generators
 
@@ -595,3 +684,8 @@ class Interval(IOable, abc.Container, abc.Hashable):
       assert isinstance(object, (List, Tuple)) and len(object) == 2
       assert all([isinstance(item, (Real, str)) for item in object])
       return Interval(*object)
+
+
+# shared unit Interval, the default (and bounding) size percentage range;
+# only ever read, never returned to callers
+_UNIT = Interval(0, 1)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+
+"""
+Interval Index
+
+Implements the IntervalIndex class, a static index over a collection of
+Intervals, for efficiently querying all of the Intervals that overlap with a
+given query Interval, without testing every Interval in the collection. The
+Intervals are kept sorted by their lower bounding values, along with the
+running (prefix) maximum of their upper bounding values; thus, the candidate
+Intervals for a query are found with two binary searches. Also indexes bare
+lower and upper bounding values arrays, such as the bounds of a RegionSet
+along one dimension, without constructing any Intervals.
+
+Classes:
+- IntervalIndex
+"""
+
+from typing import Iterator, List
+
+from numpy import argsort, array, asarray, maximum, ndarray as NDArray
+
+from .interval import Interval
+
+
+class IntervalIndex:
+  """
+  A static index over a collection of Intervals, for querying all of the
+  Intervals that overlap with a given query Interval in O(log N + M) time,
+  where M is the number of candidate Intervals within the range between
+  the binary searches, instead of O(N).
+
+  Attributes:
+    intervals:  The indexed Intervals, sorted by
+                their lower bounding values. Or None,
+                if indexed from bounding values arrays.
+    order:      The positions of the sorted Intervals,
+                in the order they were given.
+    lowers:     The sorted lower bounding values.
+    uppers:     The upper bounding values, in the
+                same order as the lower bounding values.
+    maxuppers:  The running (prefix) maximum of the
+                upper bounding values.
+  """
+  intervals: List[Interval]
+  order: NDArray
+  lowers: NDArray
+  uppers: NDArray
+  maxuppers: NDArray
+
+  def __init__(self, lowers: NDArray, uppers: NDArray,
+                     intervals: List[Interval] = None):
+    """
+    Initialize a new IntervalIndex, for the given lower and upper bounding
+    values, and the Intervals they belong to, if any. Sorts the bounding
+    values by the lower bounding values, and computes the running (prefix)
+    maximum of the upper bounding values.
+
+    Args:
+      lowers, uppers:
+        The length N arrays of the lower and upper
+        bounding values to be indexed.
+      intervals:
+        The list of N Intervals with these bounding
+        values, or None for no Intervals.
+    """
+    lowers, uppers = asarray(lowers, dtype=float), asarray(uppers, dtype=float)
+    assert lowers.shape == uppers.shape and lowers.ndim == 1
+    assert intervals is None or len(intervals) == len(lowers)
+
+    self.order = argsort(lowers, kind='stable')
+    self.lowers = lowers[self.order]
+    self.uppers = uppers[self.order]
+    self.maxuppers = maximum.accumulate(self.uppers)
+    self.intervals = None if intervals is None else \
+                     [intervals[k] for k in self.order]
+
+  ### Methods: Queries
+
+  def __len__(self) -> int:
+    """
+    The number of Intervals in this IntervalIndex.
+
+    Returns:
+      The number of Intervals in this IntervalIndex.
+    """
+    return len(self.lowers)
+
+  def overlapping(self, query: Interval) -> Iterator[Interval]:
+    """
+    Iterate over all of the indexed Intervals that overlap with the given
+    query Interval, with the same semantics as Interval.overlaps, in the
+    order of their lower bounding values.
+
+    Args:
+      query:  The Interval to find the overlapping
+              Intervals with.
+
+    Returns:
+      An iterator of all of the indexed Intervals that
+      overlap with the given query Interval.
+    """
+    assert self.intervals is not None
+
+    for k in self.overlapping_indices(query):
+      yield self.intervals[k]
+
+  def overlapping_indices(self, query: Interval) -> List[int]:
+    """
+    Compute the positions, within the sorted Intervals, of all of the indexed
+    Intervals that overlap with the given query Interval.
+
+    Args:
+      query:  The Interval to find the overlapping
+              Intervals with.
+
+    Returns:
+      The sorted list of positions of the indexed
+      Intervals that overlap with the query.
+    """
+    assert isinstance(query, Interval)
+
+    return self._overlapping(query.lower, query.upper).tolist()
+
+  def overlapping_order(self, lower: float, upper: float) -> NDArray:
+    """
+    Compute the positions, in the order they were given, of all of the indexed
+    lower and upper bounding values that overlap with the given lower and upper
+    bounding values, with the same semantics as Interval.overlaps. Queries
+    the bounding values directly, without constructing an Interval.
+
+    Args:
+      lower, upper:
+        The lower and upper bounding values to find
+        the overlapping indexed bounding values with.
+
+    Returns:
+      The array of positions, in the order given to this
+      IntervalIndex, of the overlapping bounding values.
+    """
+    return self.order[self._overlapping(lower, upper)]
+
+  def _overlapping(self, lower: float, upper: float) -> NDArray:
+    """
+    Compute the sorted positions, within the sorted bounding values, of all
+    of the indexed bounding values that overlap with the given lower and upper
+    bounding values. Bounding values with lower bounding values greater than
+    the given upper bounding value, or with prefix maximum upper bounding
+    values less than the given lower bounding value, cannot overlap; the
+    remaining candidates are tested together.
+
+    Args:
+      lower, upper:
+        The lower and upper bounding values to find
+        the overlapping indexed bounding values with.
+
+    Returns:
+      The sorted array of positions of the indexed
+      bounding values that overlap.
+    """
+    end   = self.lowers.searchsorted(upper, side='right')
+    start = self.maxuppers[0:end].searchsorted(lower, side='left')
+
+    lowers, uppers = self.lowers[start:end], self.uppers[start:end]
+    matches = ((lowers < upper) & (lower < uppers)) | \
+              ((lowers == lower) & (uppers == upper))
+
+    return matches.nonzero()[0] + start
+
+  ### Class Methods: Generators
+
+  @classmethod
+  def from_intervals(cls, intervals: List[Interval]) -> 'IntervalIndex':
+    """
+    Construct a new IntervalIndex from the given list of Intervals.
+
+    Args:
+      intervals:  The list of Intervals to be indexed.
+
+    Returns:
+      The newly constructed IntervalIndex.
+    """
+    assert isinstance(intervals, List)
+    assert all([isinstance(i, Interval) for i in intervals])
+
+    return cls(array([i.lower for i in intervals], dtype=float),
+               array([i.upper for i in intervals], dtype=float), intervals)
+
+  @classmethod
+  def from_bounds(cls, lowers: NDArray, uppers: NDArray) -> 'IntervalIndex':
+    """
+    Construct a new IntervalIndex from the given arrays of lower and upper
+    bounding values, without constructing any Intervals; thus, only
+    IntervalIndex.overlapping_order can be queried.
+
+    Args:
+      lowers, uppers:
+        The length N arrays of the lower and upper
+        bounding values to be indexed.
+
+    Returns:
+      The newly constructed IntervalIndex.
+    """
+    return cls(lowers, uppers)
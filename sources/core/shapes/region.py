@@ -19,14 +19,19 @@ Classes:
 """
 
 from collections import abc
-from dataclasses import asdict, astuple, dataclass, field
+from copy import deepcopy
+from dataclasses import asdict, is_dataclass
 from functools import reduce
 from numbers import Real
+from operator import mul, sub
 from typing import Any, Callable, Dict, List, Tuple, Union
 from uuid import uuid4
+from weakref import ReferenceType
+
+from numpy import array, asarray, column_stack, maximum, minimum
 
 from sources.abstract import IOable
-from sources.helpers import NDArray, RandomFn, Randoms
+from sources.helpers import DEBUG_INVARIANTS, NDArray, RandomFn, Randoms
 
 from .interval import Interval
 
@@ -35,12 +40,12 @@ RegionPair    = Tuple['Region', 'Region']
 RegionIntxn   = List['Region']
 RegionGrp     = Union['Region', RegionIntxn, RegionPair]
 RegionId      = Union['Region', str]
+
 RegionIdPair  = Tuple[RegionId, RegionId]
 RegionIdIntxn = List[RegionId]
 RegionIdGrp   = Union[RegionId, RegionIdIntxn, RegionIdPair]
 
 
-@dataclass
 class Region(IOable, abc.Container):
   """
   A multidimensional region, with an upper and lower vertex.
@@ -57,13 +62,29 @@ class Region(IOable, abc.Container):
   Attributes:
     id:         The unique identifier for this Region.
     dimension:  The number of dimensions (dimensionality).
-    dimensions: The Interval (bounds) for each dimension.
+    dimensions: The Interval (bounds) for each dimension,
+                as a tuple of frozen Intervals; reassigned
+                only through Region.__setitem__, since the
+                bounding values are cached. Constructed
+                on first access.
     data:       Additional data properties.
+    _size:      The precomputed magnitude size
+                of the Region.
+    _lower, _upper:
+                The lower and upper bounding values
+                for each dimension, as lists of float.
+    _owners:    The weak references to the collections that
+                copied the bounding values of this Region,
+                to be notified when a dimension is reassigned.
+                None, until first added to a collection.
   """
+  __slots__ = ('id', 'dimension', 'dimensions', 'data', '_size', '_lower', '_upper',
+               '_owners')
+
   id: str
-  dimension: int = field(repr=False)
-  dimensions: List[Interval] = field(repr=False)
-  data: Dict = field(repr=False)
+  dimension: int
+  dimensions: Tuple[Interval, ...]
+  data: Dict
 
   def __init__(self, lower: List[float], upper: List[float], id: str = '',
                      dimension: int = 0, **kwargs):
@@ -73,18 +94,22 @@ class Region(IOable, abc.Container):
     number of dimensions (dimensionality), otherwise computes the dimension
     from the lower and upper vertices, which must have matching number of
     dimensions. If id is specified, sets it as the unique identifier for this
-    Region, otherwise generates a random identifier, UUID v4. Generates the
-    dimensions (list of Intervals) from the lower and upper vertices. If lower
-    vertex has values greater than its corresponding upper values, swaps the
-    lower and upper values. Additional named arguments given will be assigned
-    to as data properties.
+    Region, otherwise generates a random identifier, UUID v4, when first
+    accessed, if not assigned before then; thus, callers that assign their
+    own identifiers, such as RegionSet.from_random, never generate one.
+    Converts the lower and upper vertices to lists of float. If lower vertex
+    has values greater than its corresponding upper values, swaps the lower
+    and upper values. The dimensions (tuple of Intervals) are only generated
+    from the lower and upper vertices when first accessed. Additional named
+    arguments given will be assigned to as data properties.
 
     Args:
       lower, upper:
         The lower and upper bounding vertices.
       id:
         The unique identifier for this Region
-        Randonly generated with UUID v4, if not provided.
+        Randonly generated with UUID v4,
+        on first access, if not provided.
       dimension:
         The number of dimensions (dimensionality) of
         this Region. must match that number of
@@ -92,23 +117,56 @@ class Region(IOable, abc.Container):
       kwargs:
         To be assigned as data properties.
     """
-    if len(id) == 0:
-      id = str(uuid4())
     if dimension <= 0:
       dimension = len(lower)
 
-    assert len(id) > 0
+    assert isinstance(id, str)
     assert isinstance(lower, List) and all([isinstance(l, Real) for l in lower])
     assert isinstance(upper, List) and all([isinstance(u, Real) for u in upper])
     assert dimension > 0 and len(lower) == len(upper) == dimension
 
-    self.id = id
+    if len(id) > 0:
+      self.id = id
     self.dimension = dimension
-    self.dimensions = [Interval(*i) for i in zip(lower, upper)]
+    lower, upper = [float(l) for l in lower], [float(u) for u in upper]
+    self._lower = list(map(min, lower, upper))
+    self._upper = list(map(max, lower, upper))
+    self._size = reduce(mul, map(sub, self._upper, self._lower))
+    self._owners = None
     self.data = {}
     for k, v in kwargs.items():
       self.data[k] = v
 
+    if DEBUG_INVARIANTS:
+      assert self._instance_invariant
+
+  def __getattr__(self, name: str) -> Any:
+    """
+    Called when the default attribute access fails with an AttributeError.
+    Generates the dimensions (tuple of frozen Intervals) from the lower and
+    upper bounding values, or the random identifier, UUID v4, if none was
+    given, on first access, and assigns them, such that subsequent accesses
+    do not call this method.
+
+    Args:
+      name: The attribute name.
+
+    Returns:
+      The dimensions, when name is 'dimensions',
+      or the identifier, when name is 'id'.
+
+    Raises:
+      AttributeError: Any other attribute name.
+    """
+    if name == 'dimensions':
+      self.dimensions = tuple(Interval(l, u).freeze() for l, u in zip(self._lower, self._upper))
+      return self.dimensions
+    if name == 'id':
+      self.id = Region.new_uuid()
+      return self.id
+
+    raise AttributeError(name)
+
   ### Properties: Getters
 
   @property
@@ -122,11 +180,9 @@ class Region(IOable, abc.Container):
       True: If instance invariant holds
       False: Otherwise.
     """
-    return all([
-      isinstance(self.dimensions, List),
-      self.dimension == len(self.dimensions),
-      all([isinstance(d, Interval) for d in self.dimensions])
-    ])
+    return isinstance(self.dimensions, Tuple) and \
+           self.dimension == len(self.dimensions) and \
+           all(isinstance(d, Interval) for d in self.dimensions)
 
   @property
   def lower(self) -> List[float]:
@@ -138,7 +194,7 @@ class Region(IOable, abc.Container):
     Returns:
       The lower bounding vertex of this Region.
     """
-    return [d.lower for d in self.dimensions]
+    return list(self._lower)
 
   @property
   def upper(self) -> List[float]:
@@ -150,7 +206,7 @@ class Region(IOable, abc.Container):
     Returns:
       The upper bounding vertex of this Region.
     """
-    return [d.upper for d in self.dimensions]
+    return list(self._upper)
 
   @property
   def lengths(self) -> List[float]:
@@ -161,7 +217,7 @@ class Region(IOable, abc.Container):
     Returns:
       List of distances for each dimension.
     """
-    return [d.length for d in self.dimensions]
+    return list(map(sub, self._upper, self._lower))
 
   @property
   def midpoint(self) -> List[float]:
@@ -173,24 +229,26 @@ class Region(IOable, abc.Container):
       The point at the midpoint or center of
       Region along all dimensions.
     """
-    return [d.midpoint for d in self.dimensions]
+    return [(l + u) / 2 for l, u in zip(self._lower, self._upper)]
 
   @property
   def size(self) -> float:
     """
     The magnitude size of the Region; length, area, volume.
-    Computed by multiply all the dimensional lengths (sides) together.
+    Computed by multiply all the dimensional lengths (sides) together,
+    once on initialization and whenever a dimension is reassigned.
 
     Returns:
       The magnitude size of the Region.
     """
-    return reduce(lambda x, y: x * y, self.lengths)
+    return self._size
 
   ### Methods: Assignment
 
   def __getitem__(self, index: Union[int, str]) -> Union[Interval, Any]:
     """
-    Retrieves the Interval for associated dimension when index is an int.
+    Retrieves the frozen Interval for associated dimension when index is an
+    int; reassign the dimension through Region.__setitem__ instead.
     Retrieves the data value for associated data property when index is a str.
 
     Is syntactic sugar for:
@@ -222,7 +280,9 @@ class Region(IOable, abc.Container):
 
   def __setitem__(self, index: Union[int, str], value: Union[Interval, Any]):
     """
-    Assigns the given index as int (dimension) with the given Interval.
+    Assigns the given index as int (dimension) with a frozen copy of the
+    given Interval, updates the cached bounds and size, and notifies the
+    collections that copied the bounding values of this Region.
     Assigns the given index as str (datakey) with the given value to the
     data properties.
 
@@ -246,7 +306,36 @@ class Region(IOable, abc.Container):
       assert isinstance(value, Interval)
       assert 0 <= index < self.dimension
 
-      self.dimensions[index] = value
+      dimensions = list(self.dimensions)
+      dimensions[index] = value.copy().freeze()
+      self.dimensions = tuple(dimensions)
+      self._lower[index] = value.lower
+      self._upper[index] = value.upper
+      self._size = reduce(mul, map(sub, self._upper, self._lower))
+
+      for owner in self._owners or []:
+        regions = owner()
+        if regions is not None:
+          regions._invalidate()
+
+  def _add_owner(self, owner: ReferenceType):
+    """
+    Register the given weak reference to a collection that copied the
+    bounding values of this Region, to be notified, with its _invalidate
+    method, when a dimension of this Region is reassigned. The references
+    to collections that no longer exist are dropped once they accumulate.
+
+    Args:
+      owner:  The weak reference to the collection.
+    """
+    owners = self._owners
+    if owners is None:
+      self._owners = [owner]
+      return
+
+    if len(owners) >= 8:
+      owners[:] = [o for o in owners if o() is not None]
+    owners.append(owner)
 
   ### Methods: Representations
 
@@ -420,11 +509,15 @@ class Region(IOable, abc.Container):
       False:  Otherwise.
     """
     assert isinstance(point, List)
-    assert all([isinstance(x, float) for x in point])
     assert self.dimension == len(point)
+    if DEBUG_INVARIANTS:
+      assert all([isinstance(x, float) for x in point])
+
+    for l, u, x in zip(self._lower, self._upper, point):
+      if (x < l if inc_lower else x <= l) or (x > u if inc_upper else x >= u):
+        return False
 
-    return all([d.contains(point[i], inc_lower, inc_upper) \
-                for i, d in enumerate(self.dimensions)])
+    return True
 
   def encloses(self, that: 'Region', inc_lower = True, inc_upper = True) -> bool:
     """
@@ -453,8 +546,77 @@ class Region(IOable, abc.Container):
     if self == that:
       return True
 
-    return all([d.encloses(that[i], inc_lower, inc_upper) \
-                for i, d in enumerate(self.dimensions)])
+    for sl, su, tl, tu in zip(self._lower, self._upper, that._lower, that._upper):
+      if (tl < sl if inc_lower else tl <= sl) or (tu > su if inc_upper else tu >= su):
+        return False
+
+    return True
+
+  def contains_many(self, points: NDArray, inc_lower = True, inc_upper = True) -> NDArray:
+    """
+    Determine if each of the given points lies within the lower and upper
+    bounding vertices, where the points are given as a (N, dimension) array.
+    Same semantics as contains(), vectorized over all of the given points.
+
+    Args:
+      points:
+        The (N, dimension) array of points to test
+        if they lie within this Region's bounds.
+      inc_lower, inc_upper:
+        Boolean flag for whether or not to include or
+        to exclude the lower or upper bounding vertics
+        of this Region. If inc_lower is True, includes
+        the lower bounding vertex, otherwise excludes it.
+        Likewise, if inc_upper is True, includes the
+        upper bounding vertex, otherwise excludes it.
+
+    Returns:
+      The length N boolean array, where [i] is True
+      if the i-th point lies within the Region.
+    """
+    points = asarray(points, dtype=float)
+    assert points.ndim == 2 and points.shape[1] == self.dimension
+
+    lower, upper = array(self._lower), array(self._upper)
+    gte_lower = lower <= points if inc_lower else lower < points
+    lte_upper = points <= upper if inc_upper else points < upper
+
+    return (gte_lower & lte_upper).all(axis=1)
+
+  def encloses_many(self, lowers: NDArray, uppers: NDArray,
+                          inc_lower = True, inc_upper = True) -> NDArray:
+    """
+    Determine if each of the given Regions lies within this Region, where the
+    Regions are given as (N, dimension) arrays of their lower and upper
+    bounding vertices, rather than as Region objects. Same semantics as
+    encloses(), vectorized over all of the given Regions.
+
+    Args:
+      lowers, uppers:
+        The (N, dimension) arrays of the lower and
+        upper bounding vertices of the other Regions.
+      inc_lower, inc_upper:
+        Boolean flag for whether or not to include or
+        to exclude the lower or upper bounding vertics
+        of this Region. If inc_lower is True, includes
+        the lower bounding vertex, otherwise excludes it.
+        Likewise, if inc_upper is True, includes the
+        upper bounding vertex, otherwise excludes it.
+
+    Returns:
+      The length N boolean array, where [i] is True if
+      the i-th Region lies entirely within this Region.
+    """
+    lowers, uppers = asarray(lowers, dtype=float), asarray(uppers, dtype=float)
+    assert lowers.shape == uppers.shape
+    assert lowers.ndim == 2 and lowers.shape[1] == self.dimension
+
+    lower, upper = array(self._lower), array(self._upper)
+    gte_lower = lower <= lowers if inc_lower else lower < lowers
+    lte_upper = uppers <= upper if inc_upper else uppers < upper
+    equal     = ((lower == lowers) & (upper == uppers)).all(axis=1)
+
+    return (gte_lower & lte_upper).all(axis=1) | equal
 
   def __contains__(self, value: Union['Region', List[float], str]) -> bool:
     """
@@ -487,7 +649,11 @@ class Region(IOable, abc.Container):
               property exists within this Region.
       False:  Otherwise.
     """
-    if isinstance(value, Region):
+    # exact type checks first, to bypass ABCMeta.__instancecheck__
+    kind = type(value)
+    if kind is str:
+      return value in self.data
+    elif kind is Region or isinstance(value, Region):
       return self.encloses(value)
     elif isinstance(value, str):
       return value in self.data
@@ -550,7 +716,52 @@ class Region(IOable, abc.Container):
     assert isinstance(that, Region)
     assert self.dimension == that.dimension
 
-    return all([d.overlaps(that[i]) for i, d in enumerate(self.dimensions)])
+    # unrolled, for the common 2D and 3D Regions
+    if self.dimension == 2:
+      (sl0, sl1), (su0, su1) = self._lower, self._upper
+      (tl0, tl1), (tu0, tu1) = that._lower, that._upper
+      return ((sl0 < tu0 and tl0 < su0) or (sl0 == tl0 and su0 == tu0)) and \
+             ((sl1 < tu1 and tl1 < su1) or (sl1 == tl1 and su1 == tu1))
+    if self.dimension == 3:
+      (sl0, sl1, sl2), (su0, su1, su2) = self._lower, self._upper
+      (tl0, tl1, tl2), (tu0, tu1, tu2) = that._lower, that._upper
+      return ((sl0 < tu0 and tl0 < su0) or (sl0 == tl0 and su0 == tu0)) and \
+             ((sl1 < tu1 and tl1 < su1) or (sl1 == tl1 and su1 == tu1)) and \
+             ((sl2 < tu2 and tl2 < su2) or (sl2 == tl2 and su2 == tu2))
+
+    # same as Interval.overlaps, for each dimension
+    for sl, su, tl, tu in zip(self._lower, self._upper, that._lower, that._upper):
+      if (su <= tl or tu <= sl) and (sl != tl or su != tu):
+        return False
+
+    return True
+
+  def overlaps_many(self, lowers: NDArray, uppers: NDArray) -> NDArray:
+    """
+    Determine if each of the given Regions overlaps with this Region,
+    where the Regions are given as (N, dimension) arrays of their lower and
+    upper bounding vertices, rather than as Region objects. Same semantics
+    as overlaps(), vectorized over all of the given Regions: along each
+    dimension, the Intervals overlap if they are equal or if each Interval's
+    lower bound is less than the other Interval's upper bound.
+
+    Args:
+      lowers, uppers:
+        The (N, dimension) arrays of the lower and
+        upper bounding vertices of the other Regions.
+
+    Returns:
+      The length N boolean array, where [i] is True
+      if the i-th Region overlaps with this Region.
+    """
+    lowers, uppers = asarray(lowers, dtype=float), asarray(uppers, dtype=float)
+    assert lowers.shape == uppers.shape
+    assert lowers.ndim == 2 and lowers.shape[1] == self.dimension
+
+    lower, upper = array(self.lower), array(self.upper)
+
+    return (((lower < uppers) & (lowers < upper)) | \
+            ((lower == lowers) & (upper == uppers))).all(axis=1)
 
   ### Methods: Equality + Comparison
 
@@ -576,7 +787,8 @@ class Region(IOable, abc.Container):
     """
     return isinstance(that, Region) and \
            self.dimension == that.dimension and \
-           all([d == that[i] for i, d in enumerate(self.dimensions)])
+           self._lower == that._lower and \
+           self._upper == that._upper
 
   ### Methods: Generators
 
@@ -631,8 +843,13 @@ class Region(IOable, abc.Container):
     assert isinstance(that, Region)
     assert self.dimension == that.dimension
 
-    if not self.overlaps(that):
-      return None
+    # overlaps and intersecting bounds, in a single pass over the dimensions
+    lower, upper = [], []
+    for sl, su, tl, tu in zip(self._lower, self._upper, that._lower, that._upper):
+      if (su <= tl or tu <= sl) and (sl != tl or su != tu):
+        return None
+      lower.append(sl if sl > tl else tl)
+      upper.append(su if su < tu else tu)
 
     data = {}
     if any([linked == True, linked == 'reference', \
@@ -645,8 +862,34 @@ class Region(IOable, abc.Container):
     elif linked != False:
       raise ValueError(f'Invalid linked "{linked}" mode')
 
-    return Region.from_intervals([d.intersect(that[i]) \
-                  for i, d in enumerate(self.dimensions)], **data)
+    return Region(lower, upper, **data)
+
+  def intersect_many(self, lowers: NDArray, uppers: NDArray) -> Tuple[NDArray, NDArray, NDArray]:
+    """
+    Compute the overlapping Regions between this Region and each of the given
+    Regions, where the Regions are given as (N, dimension) arrays of their
+    lower and upper bounding vertices, rather than as Region objects. Same
+    semantics as intersect(), vectorized over all of the given Regions: the
+    overlapping bounding vertices are the element-wise maximum of the lower
+    and minimum of the upper bounding vertices, for those that overlap.
+
+    Args:
+      lowers, uppers:
+        The (N, dimension) arrays of the lower and
+        upper bounding vertices of the other Regions.
+
+    Returns:
+      The length N boolean array, where [i] is True if
+      the i-th Region overlaps with this Region (see
+      overlaps_many), and the (K, dimension) arrays of
+      the lower and upper bounding vertices of the K
+      overlapping Regions, in the same order.
+    """
+    lowers, uppers = asarray(lowers, dtype=float), asarray(uppers, dtype=float)
+    overlaps = self.overlaps_many(lowers, uppers)
+
+    return overlaps, maximum(lowers[overlaps], self._lower), \
+                     minimum(uppers[overlaps], self._upper)
 
   def union(self, that: 'Region', linked: Union[bool, str] = False) -> 'Region':
     """
@@ -709,8 +952,8 @@ class Region(IOable, abc.Container):
     elif linked != False:
       raise ValueError(f'Invalid linked "{linked}" mode')
 
-    return Region.from_intervals([d.union(that[i]) \
-                  for i, d in enumerate(self.dimensions)], **data)
+    return Region(list(map(min, self._lower, that._lower)),
+                  list(map(max, self._upper, that._upper)), **data)
 
   def project(self, dimension: int,
                     interval: Interval = Interval(0, 0),
@@ -742,8 +985,7 @@ class Region(IOable, abc.Container):
     """
     assert dimension > 0
 
-    dimensions = [Interval(*astuple(interval \
-                  if d >= self.dimension else self[d])) \
+    dimensions = [(interval if d >= self.dimension else self[d]).copy() \
                   for d in range(dimension)]
 
     return Region.from_intervals(dimensions, **kwargs)
@@ -797,7 +1039,9 @@ class Region(IOable, abc.Container):
     Intervals where the lower and upper bounding values are rounded/truncated
     to the specified precision (number of digits after the decimal point).
     If precision is None, the lower and upper bounding values are of arbitrary
-    precision. Additional arguments passed through to Region.from_intervals.
+    precision. The bounding values are generated for all N Regions at once,
+    one dimension at a time, by Interval.random_bounds(). Additional arguments
+    passed through to Region.__init__.
 
     Args:
       nregions:   The number of Regions to be generated.
@@ -813,7 +1057,7 @@ class Region(IOable, abc.Container):
                   point for the lower and upper bounding
                   values, or None for arbitrary precision.
       kwargs:     Additional arguments passed through to
-                  Region.from_intervals.
+                  Region.__init__.
 
     Returns:
       List of randonly generated Regions
@@ -836,17 +1080,31 @@ class Region(IOable, abc.Container):
              all(isinstance(f, Callable) for f in rng) and \
              len(rng) == self.dimension
 
-    regions = []
-    for _ in range(nregions):
-      region = []
-      for i, d in enumerate(self.dimensions):
-        dimension = d.random_intervals(1, sizepc[i], posnrng[i], sizerng[i], precision)[0]
-        region.append(dimension)
-      regions.append(Region.from_intervals(region, **kwargs))
-    return regions
+    if nregions <= 0:
+      return []
+
+    dims = self.dimensions
+    bounds = [dims[i].random_bounds(nregions, sizepc[i], posnrng[i], sizerng[i], precision)
+              for i in range(self.dimension)]
+
+    lowers = column_stack([lower for lower, _ in bounds]).tolist()
+    uppers = column_stack([upper for _, upper in bounds]).tolist()
+
+    return [Region(lower, upper, **kwargs) for lower, upper in zip(lowers, uppers)]
 
   ### Class Methods: Generators
 
+  @classmethod
+  def new_uuid(cls) -> str:
+    """
+    Generate a random unique identifier, UUID v4, for a Region. Called on
+    the first access of the identifier of a Region that was not given one.
+
+    Returns:
+      A random UUID v4, as a string.
+    """
+    return str(uuid4())
+
   @classmethod
   def from_intervals(cls, dimensions: List[Interval],
                           id: str = '', **kwargs) -> 'Region':
@@ -935,14 +1193,19 @@ class Region(IOable, abc.Container):
     assert all([isinstance(r, Region) for r in regions])
     assert all([regions[0].dimension == r.dimension for r in regions])
 
-    dimensions = zip(*list(map(lambda r: r.dimensions, regions)))
-    dimensions = [Interval.from_intersect(list(d)) for d in dimensions]
-    if any([d == None for d in dimensions]):
-      return None
+    # same as Interval.from_intersect, for each dimension
+    lower, upper = regions[0].lower, regions[0].upper
+    for region in regions[1:]:
+      lowers, uppers = region._lower, region._upper
+      for i in range(region.dimension):
+        l, u = lowers[i], uppers[i]
+        if (upper[i] <= l or u <= lower[i]) and (lower[i] != l or upper[i] != u):
+          return None
+        lower[i], upper[i] = max(lower[i], l), min(upper[i], u)
 
     data = {'intersect': regions.copy()} if linked else {}
 
-    return cls.from_intervals(dimensions, id, **data)
+    return cls(lower, upper, id, **data)
 
   @classmethod
   def from_union(cls, regions: List['Region'],
@@ -969,11 +1232,11 @@ class Region(IOable, abc.Container):
     assert all([isinstance(r, Region) for r in regions])
     assert all([regions[0].dimension == r.dimension for r in regions])
 
-    dimensions = zip(*list(map(lambda r: r.dimensions, regions)))
-    dimensions = [Interval.from_union(list(d)) for d in dimensions]
+    lower = list(map(min, *[r._lower for r in regions]))
+    upper = list(map(max, *[r._upper for r in regions]))
     data = {'union': regions.copy()} if linked else {}
 
-    return cls.from_intervals(dimensions, id, **data)
+    return cls(lower, upper, id, **data)
 
   ### Class Methods: (De)serialization
 
@@ -1010,7 +1273,7 @@ class Region(IOable, abc.Container):
     if iscompact:
       dictobj = dict(map(lambda f: (f, getattr(object, f)), fieldnames))
     else:
-      dictobj = asdict(object)
+      dictobj = cls._asdict(object)
 
     if 'data' in dictobj:
       if dictobj['data'] is object.data:
@@ -1031,6 +1294,36 @@ class Region(IOable, abc.Container):
 
     return dictobj
 
+  @classmethod
+  def _asdict(cls, value: Any) -> Any:
+    """
+    Recursively convert the given value into plain Python objects, in the
+    same manner as dataclasses.asdict: Regions and dataclasses (Intervals)
+    become dicts of their fields, lists, tuples and dicts are converted
+    element-wise, and all other values are deep-copied.
+
+    Args:
+      value:  The value to be converted.
+
+    Returns:
+      The converted value.
+    """
+    if isinstance(value, Region):
+      return {
+        'id': value.id,
+        'dimension': value.dimension,
+        'dimensions': [asdict(d) for d in value.dimensions],
+        'data': cls._asdict(value.data)
+      }
+    elif is_dataclass(value) and not isinstance(value, type):
+      return asdict(value)
+    elif isinstance(value, (list, tuple)):
+      return type(value)(cls._asdict(v) for v in value)
+    elif isinstance(value, dict):
+      return type(value)((cls._asdict(k), cls._asdict(v)) for k, v in value.items())
+    else:
+      return deepcopy(value)
+
   @classmethod
   def from_dict(cls, object: Dict, id: str = '') -> 'Region':
     """
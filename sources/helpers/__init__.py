@@ -1,4 +1,5 @@
 #!/usr/bin/env python
 
 from .base26 import *
+from .debug import *
 from .randoms import *
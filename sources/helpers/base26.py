@@ -13,11 +13,20 @@ Example:
 
 Methods:
 - to_base26
+- to_base26_many
+- base26_sequence
 - from_base26
+- from_base26_many
 """
 
-from functools import reduce
 from string import ascii_uppercase as alphabet
+from typing import Iterator, List, Union
+
+from numpy import arange, array, asarray, bytes_, frombuffer, \
+                  int64, maximum, ndarray as NDArray, power, uint8, where, zeros
+
+
+_ALPHABET = alphabet.encode('ascii')
 
 
 def to_base26(num: int) -> str:
@@ -36,18 +45,84 @@ def to_base26(num: int) -> str:
   """
   assert num > 0
 
-  def divmod_base26(n):
-    a, b = divmod(n, 26)
-    if b == 0:
-      return a - 1, b + 26
-    return a, b
-
-  chars = []
+  chars = bytearray()
   while num > 0:
-    num, d = divmod_base26(num)
-    chars.append(alphabet[d - 1])
+    num, d = divmod(num - 1, 26)
+    chars.append(_ALPHABET[d])
+
+  chars.reverse()
+  return chars.decode('ascii')
+
+
+def to_base26_many(nums: Union[List[int], NDArray]) -> List[str]:
+  """
+  Convert the given decimal integers to Base26 numbers, all at once.
+  Computes the number of letters of each Base26 number, then the digits of
+  all Base26 numbers, one place value at a time, into a single zero-padded
+  matrix of ASCII bytes that is decoded into the list of str.
+
+  Args:
+    nums:
+      The list or array of decimal integers to be
+      converted to Base26 numbers. Must be greater
+      than zero.
 
-  return ''.join(reversed(chars))
+  Returns:
+    The list of str representations of
+    Base26 numbers.
+  """
+  nums = asarray(nums, dtype=int64)
+  assert nums.ndim == 1 and len(nums) > 0 and (nums > 0).all()
+
+  lengths = zeros(len(nums), dtype=int64)
+  rest = nums
+  while (rest > 0).any():
+    lengths += rest > 0
+    rest = where(rest > 0, (rest - 1) // 26, 0)
+
+  width = int(lengths.max())
+  chars = zeros((len(nums), width), dtype=uint8)
+  rows  = arange(len(nums))
+  rest  = nums
+  for place in range(width):
+    active = rest > 0
+    chars[rows[active], lengths[active] - 1 - place] = \
+      _ALPHABET[0] + (rest[active] - 1) % 26
+    rest = where(active, (rest - 1) // 26, 0)
+
+  return chars.view(f'S{width}').ravel().astype(str).tolist()
+
+
+def base26_sequence(start: int = 1) -> Iterator[str]:
+  """
+  Generate the successive Base26 numbers, starting from the given decimal
+  integer: A, B, C, ..., Z, AA, AB, ... Increments the letters of the
+  previous Base26 number in place, carrying from the last letter, rather
+  than converting each decimal integer anew.
+
+  Args:
+    start:
+      The decimal integer of the first Base26 number
+      to be generated. Must be greater than zero.
+
+  Returns:
+    An infinite iterator of the str representations
+    of successive Base26 numbers.
+  """
+  assert start > 0
+
+  first, last = _ALPHABET[0], _ALPHABET[-1]
+  chars = bytearray(to_base26(start).encode('ascii'))
+  while True:
+    yield chars.decode('ascii')
+    place = len(chars) - 1
+    while place >= 0 and chars[place] == last:
+      chars[place] = first
+      place -= 1
+    if place < 0:
+      chars.insert(0, first)
+    else:
+      chars[place] += 1
 
 
 def from_base26(chars: str) -> int:
@@ -62,8 +137,53 @@ def from_base26(chars: str) -> int:
 
   Returns:
     The numeric representation as an int.
+
+  Raises:
+    ValueError: chars has letters other than A-Z.
   """
   assert len(chars) > 0
 
-  return reduce(lambda r, x: r * 26 + x + 1, \
-                map(alphabet.index, chars), 0)
+  num = 0
+  for b in chars.encode('ascii'):
+    if not _ALPHABET[0] <= b <= _ALPHABET[-1]:
+      raise ValueError(f'{chars!r} is not a Base26 number')
+    num = num * 26 + b - 64
+
+  return num
+
+
+def from_base26_many(chars: List[str]) -> NDArray:
+  """
+  Convert the given list of Base26 numbers back to integers, all at once.
+  Decodes the ASCII bytes of all the given Base26 numbers into a single
+  zero-padded matrix of digits, then weights each digit by its place value.
+  Only Base26 numbers of up to 13 letters fit within the int64 output.
+
+  Args:
+    chars:
+      The list of str representations of Base26
+      numbers to be converted to ints.
+
+  Returns:
+    The numeric representations as an
+    array of int64.
+
+  Raises:
+    ValueError: Any of chars has letters other than A-Z.
+  """
+  assert len(chars) > 0 and all(len(c) > 0 for c in chars)
+
+  encoded = array(chars, dtype=bytes_)
+  width   = encoded.dtype.itemsize
+  digits  = frombuffer(encoded.tobytes(), dtype=uint8) \
+            .reshape(len(chars), width).astype(int64)
+
+  lengths = array([len(c) for c in chars], dtype=int64)
+  places  = lengths[:, None] - 1 - arange(width)
+  letters = (_ALPHABET[0] <= digits) & (digits <= _ALPHABET[-1])
+  if not (letters | (places < 0)).all():
+    raise ValueError('Not all of the given chars are Base26 numbers')
+
+  weights = where(places >= 0, power(26, maximum(places, 0), dtype=int64), 0)
+
+  return ((digits - 64) * weights).sum(axis=1)
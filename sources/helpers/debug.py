@@ -0,0 +1,18 @@
+#!/usr/bin/env python
+
+"""
+Debugging Flags
+
+Defines flags that enable additional, expensive runtime checks that are
+skipped by default, such as rechecking the instance invariants of the
+Interval, Region and RegionSet classes. Set by environment variables,
+before the modules are first imported.
+
+Constants:
+- DEBUG_INVARIANTS
+"""
+
+from os import environ
+
+
+DEBUG_INVARIANTS = environ.get('DEBUG_INVARIANTS', '0') not in ['', '0']
@@ -14,19 +14,55 @@ Types:
 - NDArray
 - RandomFn
 
+Constants:
+- PARALLEL_THRESHOLD
+
 Classes:
 - Randoms
+- SeededRandoms
 """
 
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache, partial
+from multiprocessing import cpu_count
 from typing import Callable, Dict, List, Union
 
-from numpy import ndarray, mean, random
+from numpy import add, asarray, empty, multiply, ndarray, mean, random, sort
+from numpy.random import default_rng, Generator, PCG64, SeedSequence
 
 
 ShapeSize = Union[None, int, List[int]]
 NDArray   = ndarray
 RandomFn  = Callable[[ShapeSize, float, float], NDArray]
 
+PARALLEL_THRESHOLD = 100000
+
+
+def _uniform_rng(size: int = 1, lower: float = 0, upper: float = 1,
+                 out: NDArray = None):
+  """
+  Draws samples from a uniform distribution over the half-open interval
+  [lower, upper). Takes no configuration, so it is defined once at module
+  level and returned as is by Randoms.uniform(). If out is given, fills
+  the preallocated array in-place, with Randoms.fill_uniform(), and
+  ignores size.
+  """
+  if out is not None:
+    return Randoms.fill_uniform(out, lower, upper)
+
+  return random.uniform(lower, upper, size)
+
+
+def _triangular_rng(size: int = 1, left: float = 0, right: float = 1,
+                    mode: float = 0.5):
+  """
+  Draws samples from the triangular distribution over the interval
+  [left, right], with its peak at the given percentage of the total length.
+  Randoms.triangular() binds the mode with functools.partial, rather than
+  constructing a new closure for every random number generator.
+  """
+  return random.triangular(left, (right - left)*mode + left, right, size)
+
 
 class Randoms:
   """
@@ -35,7 +71,16 @@ class Randoms:
   particular distribution or random number generation function. The only
   missing parameters is the lower and upper bounds of the values generated
   and the sample size of the output.
+
+  Class Attributes:
+    _streams:   The cached, independent random number
+                generators, one per worker thread, for
+                the parallel random number generators.
+    _executor:  The persistent pool of worker threads
+                for the parallel random number generators.
   """
+  _streams: List[Generator] = []
+  _executor: ThreadPoolExecutor = None
 
   @classmethod
   def get(cls, name: str, **kwargs) -> RandomFn:
@@ -69,7 +114,29 @@ class Randoms:
       Returns:
         The randomly generated values.
     """
-    return getattr(cls, name)(**kwargs)
+    try:
+      return cls._get(name, tuple(sorted(kwargs.items())))
+    except TypeError:
+      # unhashable arguments, cannot be cached
+      return getattr(cls, name)(**kwargs)
+
+  @classmethod
+  @lru_cache(maxsize=32)
+  def _get(cls, name: str, kwargs: tuple) -> RandomFn:
+    """
+    Cached factory method dispatch for Randoms.get(). Returns the same random
+    number generator for repeated calls with the same name and arguments,
+    instead of constructing a new one for every call.
+
+    Args:
+      name:   The name of random number generator.
+      kwargs: The sorted, hashable (key, value) pairs of
+              arguments for that factory method.
+
+    Returns:
+      The cached random number generator.
+    """
+    return getattr(cls, name)(**dict(kwargs))
 
   @classmethod
   def list(cls) -> List[str]:
@@ -81,30 +148,204 @@ class Randoms:
       The list of available random number
       generators (distributions).
     """
-    excluded = ['get', 'list']
+    excluded = ['get', 'list', 'batch_intervals', 'fill_uniform', 'seeded',
+                'parallel_uniform']
     israndng = lambda f: all([callable(getattr(cls, f)), f not in excluded,
                               not f.startswith('_')])
 
     return [f for f in dir(cls) if israndng(f)]
 
+  @classmethod
+  def seeded(cls, seed: int = None) -> 'SeededRandoms':
+    """
+    Returns a reproducible set of random number generators, that draw from
+    their own private PCG64 random number generator, initialized with the
+    given seed, instead of from the global random number generator state.
+
+    Args:
+      seed: The seed for the random number generator.
+
+    Returns:
+      The seeded random number generators.
+    """
+    return SeededRandoms(seed)
+
+  ### Class Methods: Batch Generators
+
+  @classmethod
+  def batch_intervals(cls, nintervals: int, dimension: int,
+                           lower: Union[float, List[float]] = 0,
+                           upper: Union[float, List[float]] = 1,
+                           randomng: RandomFn = None,
+                           out: NDArray = None) -> NDArray:
+    """
+    Randomly generate the lower and upper bounding values for N intervals
+    along each of the specified number of dimensions, in a single call to the
+    given random number generator. Draws a (N, dimension, 2) array of samples
+    over the interval [lower, upper) for each dimension, then sorts the last
+    axis, such that each pair of values is ordered lower <= upper. If out is
+    given, the samples are drawn and sorted in-place within that preallocated
+    array, which requires a random number generator that accepts out, such
+    as Randoms.uniform().
+
+    Args:
+      nintervals: The number of intervals to be generated
+                  along each dimension.
+      dimension:  The number of dimensions.
+      lower:      The lower bounding value, or list of
+                  values (per dimension).
+      upper:      The upper bounding value, or list of
+                  values (per dimension).
+      randomng:   The random number generator that dictates
+                  the distribution of the values generated.
+                  Defaults to Randoms.uniform().
+      out:        The preallocated (N, dimension, 2) array
+                  of float64 to be filled in-place.
+
+    Returns:
+      The (N, dimension, 2) array of the lower and
+      upper bounding values of the intervals.
+    """
+    if randomng is None:
+      randomng = cls.uniform()
+
+    assert isinstance(nintervals, int) and nintervals > 0
+    assert isinstance(dimension, int) and dimension > 0
+    assert isinstance(randomng, Callable)
+
+    lower = asarray(lower, dtype=float).reshape(-1, 1)
+    upper = asarray(upper, dtype=float).reshape(-1, 1)
+
+    if out is None:
+      return sort(randomng([nintervals, dimension, 2], lower, upper), axis=-1)
+
+    assert out.shape == (nintervals, dimension, 2)
+
+    randomng([nintervals, dimension, 2], lower, upper, out=out)
+    out.sort(axis=-1)
+
+    return out
+
+  ### Class Methods: Parallel Random Number Generation
+
+  @classmethod
+  def fill_uniform(cls, out: NDArray, lower: Union[float, NDArray] = 0,
+                                      upper: Union[float, NDArray] = 1,
+                                      threads: int = 1) -> NDArray:
+    """
+    Fills the given preallocated array in-place with random values drawn
+    uniformly over the half-open interval [lower, upper). Draws over [0, 1)
+    from the global random number generator state, like Randoms.uniform()
+    without an out array, and then scales the array in-place; thus, both
+    are reproducible with numpy.random.seed. With multiple threads, if
+    larger than PARALLEL_THRESHOLD, draws directly into the array from the
+    independent random number generators of the worker threads instead.
+
+    Args:
+      out:      The preallocated, contiguous array of
+                float64 to be filled with random values.
+      lower:    The lower bounding value(s), broadcastable
+                to the shape of the array.
+      upper:    The upper bounding value(s), broadcastable
+                to the shape of the array.
+      threads:  The number of worker threads.
+
+    Returns:
+      The filled array.
+    """
+    assert isinstance(out, ndarray) and out.dtype == float
+    assert out.flags.c_contiguous
+    assert isinstance(threads, int) and threads > 0
+
+    values = out.reshape(-1)
+    if threads > 1 and len(values) > PARALLEL_THRESHOLD:
+      cls._parallel_fill(values, threads)
+    else:
+      values[...] = random.random_sample(len(values))
+
+    lower, upper = asarray(lower, dtype=float), asarray(upper, dtype=float)
+    multiply(out, upper - lower, out=out)
+    add(out, lower, out=out)
+
+    return out
+
+  @classmethod
+  def _parallel_streams(cls, threads: int) -> List[Generator]:
+    """
+    Returns the list of independent random number generators for the given
+    number of worker threads, and starts the persistent pool of worker
+    threads. Each generator is a PCG64 bit generator advanced (jumped) by
+    a different number of steps from the same seed; thus, the random number
+    streams do not overlap. The generators and worker threads are constructed
+    once and cached on the class.
+
+    Args:
+      threads:  The number of worker threads.
+
+    Returns:
+      The list of independent random number
+      generators, one per worker thread.
+    """
+    if len(cls._streams) < threads:
+      seed = PCG64()
+      cls._streams = [Generator(seed.jumped(i)) for i in range(threads)]
+      if cls._executor is not None:
+        cls._executor.shutdown(wait=False)
+      cls._executor = ThreadPoolExecutor(threads)
+
+    return cls._streams[0:threads]
+
+  @classmethod
+  def _parallel_fill(cls, out: NDArray, threads: int):
+    """
+    Fills the given preallocated array with random values drawn uniformly
+    over the half-open interval [0, 1). The array is sharded into contiguous
+    slices, each filled by its own random number generator in a separate
+    worker thread. The underlying random number generators release the GIL,
+    so the slices are filled concurrently.
+
+    Args:
+      out:      The preallocated, contiguous array of
+                float64 to be filled with random values.
+      threads:  The number of worker threads.
+    """
+    def fill(rng: Generator, lower: int, upper: int):
+      rng.random(out=out[lower:upper])
+
+    step = -(-len(out) // threads)
+    jobs = []
+
+    for i, rng in enumerate(cls._parallel_streams(threads)):
+      jobs.append(cls._executor.submit(fill, rng, i*step, (i + 1)*step))
+
+    for job in wait(jobs).done:
+      job.result()
+
   ### Class Methods: Random Number Generators
 
   @classmethod
-  def uniform(cls) -> RandomFn:
+  def uniform(cls, parallel: bool = False) -> RandomFn:
     """
     Returns a function that draws samples from a uniform distribution.
     Samples are uniformly distributed over the half-open interval [low, high)
     (includes low, but excludes high). In other words, any value within the
-    given interval is equally likely to be drawn by uniform.
+    given interval is equally likely to be drawn by uniform. If parallel,
+    returns the multithreaded variant: Randoms.parallel_uniform(). If an out
+    array is given to the returned function, it is filled in-place.
+
+    Args:
+      parallel:
+        Boolean flag for whether or not to draw
+        large samples with multiple threads.
 
     Returns:
       A factory function that draws samples
       from a uniform distribution.
     """
-    def uniform_rng(size: int = 1, lower: float = 0, upper: float = 1):
-      return random.uniform(lower, upper, size)
+    if parallel:
+      return cls.parallel_uniform()
 
-    return uniform_rng
+    return _uniform_rng
 
   @classmethod
   def triangular(cls, mode: float = 0.5) -> RandomFn:
@@ -125,7 +366,136 @@ class Randoms:
       A factory function that draws samples
       from a triangular distribution.
     """
-    def triangular_rng(size: int = 1, left: float = 0, right: float = 1):
-      return random.triangular(left, (right - left)*mode + left, right, size)
+    return partial(_triangular_rng, mode=mode)
+
+  @classmethod
+  def parallel_uniform(cls, threads: int = None) -> RandomFn:
+    """
+    Returns a function that draws samples from a uniform distribution, like
+    Randoms.uniform(), but samples larger than PARALLEL_THRESHOLD are drawn
+    with multiple threads. The output array is preallocated, sharded into
+    contiguous slices across the worker threads, each filled in-place by
+    an independent PCG64 random number generator, and then scaled in-place
+    to the half-open interval [lower, upper). If an out array is given to the
+    returned function, it is filled in-place instead.
+
+    Args:
+      threads:
+        The number of worker threads. Defaults
+        to the number of CPUs.
+
+    Returns:
+      A factory function that draws samples
+      from a uniform distribution.
+    """
+    if threads is None:
+      threads = cpu_count()
+
+    assert isinstance(threads, int) and threads > 0
+
+    def parallel_uniform_rng(size: ShapeSize = 1, lower: float = 0, upper: float = 1,
+                             out: NDArray = None):
+      if out is None:
+        shape = [] if size is None else [size] if isinstance(size, int) else size
+        out = empty(shape)
+
+      return cls.fill_uniform(out, lower, upper, threads)
+
+    return parallel_uniform_rng
+
+
+class SeededRandoms:
+  """
+  Provides the same factory methods as Randoms, but each returned Callable
+  draws samples from a private random number generator, initialized from a
+  seed, rather than from the global random number generator state. Allows
+  reproducible random values without seeding the global state, and many
+  independent, deterministic streams, one per worker, that do not share
+  any state or lock.
+
+  Attributes:
+    seedseq:  The seed sequence that initialized the
+              random number generator.
+    rng:      The private random number generator.
+  """
+  seedseq: SeedSequence
+  rng: Generator
+
+  def __init__(self, seed: Union[None, int, SeedSequence] = None):
+    """
+    Initialize a new SeededRandoms, with a private random number generator,
+    from the given seed or seed sequence. If no seed is given, the seed is
+    drawn from the operating system entropy.
+
+    Args:
+      seed: The seed or seed sequence for the
+            random number generator.
+    """
+    self.seedseq = seed if isinstance(seed, SeedSequence) else SeedSequence(seed)
+    self.rng = default_rng(self.seedseq)
+
+  def spawn(self, n: int) -> List['SeededRandoms']:
+    """
+    Create N independent, reproducible SeededRandoms from this one, with
+    child seed sequences spawned from the seed sequence of this one.
+
+    Args:
+      n:  The number of SeededRandoms to spawn.
+
+    Returns:
+      The list of spawned SeededRandoms.
+    """
+    assert isinstance(n, int) and n > 0
+
+    return [SeededRandoms(child) for child in self.seedseq.spawn(n)]
+
+  ### Methods: Random Number Generators
+
+  def uniform(self) -> RandomFn:
+    """
+    Returns a function that draws samples from a uniform distribution,
+    over the half-open interval [lower, upper), from the private random
+    number generator. Equivalent to Randoms.uniform(), including
+    filling a preallocated out array in-place.
+
+    Returns:
+      A factory function that draws samples
+      from a uniform distribution.
+    """
+    rng = self.rng
+
+    def uniform_rng(size: ShapeSize = 1, lower: float = 0, upper: float = 1,
+                    out: NDArray = None):
+      if out is None:
+        return rng.uniform(lower, upper, size)
+
+      rng.random(out=out)
+      multiply(out, asarray(upper, dtype=float) - lower, out=out)
+      add(out, lower, out=out)
+
+      return out
+
+    return uniform_rng
+
+  def triangular(self, mode: float = 0.5) -> RandomFn:
+    """
+    Returns a function that draws samples from the triangular distribution,
+    over the interval [left, right], from the private random number
+    generator. Equivalent to Randoms.triangular().
+
+    Args:
+      mode:
+        The peak value of the triangular
+        distribution as a percentage of the
+        total length.
+
+    Returns:
+      A factory function that draws samples
+      from a triangular distribution.
+    """
+    rng = self.rng
+
+    def triangular_rng(size: ShapeSize = 1, left: float = 0, right: float = 1):
+      return rng.triangular(left, (right - left)*mode + left, right, size)
 
     return triangular_rng
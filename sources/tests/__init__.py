@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+
+"""
+Unit Tests
+
+Defines flags that enable additional, expensive test cases that are
+skipped by default, such as the largest tiers of randomly generated
+RegionSets. Set by environment variables, before the tests are run.
+
+Constants:
+- RUN_LARGE_TESTS
+"""
+
+from os import environ
+
+
+RUN_LARGE_TESTS = environ.get('RUN_LARGE_TESTS', '0') not in ['', '0']
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for Base26 Converter
+
+- test_base26_roundtrip
+- test_base26_invalid
+"""
+
+from unittest import TestCase
+
+from sources.helpers import base26_sequence, from_base26, from_base26_many, \
+                            to_base26, to_base26_many
+
+
+class TestBase26(TestCase):
+
+  def test_base26_roundtrip(self):
+    nums = list(range(1, 1000)) + [26**k for k in range(1, 8)]
+    chars = [to_base26(n) for n in nums]
+    self.assertListEqual(chars[0:3] + chars[25:28], ['A', 'B', 'C', 'Z', 'AA', 'AB'])
+    self.assertListEqual(to_base26_many(nums), chars)
+    self.assertListEqual([c for c, _ in zip(base26_sequence(), range(999))], chars[0:999])
+    self.assertListEqual([from_base26(c) for c in chars], nums)
+    self.assertListEqual(from_base26_many(chars).tolist(), nums)
+
+  def test_base26_invalid(self):
+    for chars in ['a', 'A1', 'Z@', '[', 'AB C']:
+      with self.subTest(chars=chars):
+        self.assertRaises(ValueError, from_base26, chars)
+        self.assertRaises(ValueError, from_base26_many, ['AB', chars])
@@ -13,6 +13,7 @@ from unittest import TestCase
 from sources.algorithms.queries import Enumerate, RegionIntersect
 from sources.algorithms.sweepln import RegionSweepDebug, SweepTaskRunner
 from sources.core import Region, RegionIntxn, RegionSet
+from sources.tests import RUN_LARGE_TESTS
 
 
 class TestEnumerateResult(NamedTuple):
@@ -25,7 +26,8 @@ class TestEnumerate(TestCase):
 
   regions: Dict[str, RegionSet]
 
-  def setUp(self):
+  @classmethod
+  def setUpClass(cls):
     definedset = RegionSet(dimension=2)
     definedset.streamadd([
       Region([0, 0], [5, 5], 'A'),
@@ -39,13 +41,13 @@ class TestEnumerate(TestCase):
 
     bounds = Region([0]*2, [1000]*2)
 
-    self.regions = {'definedset': definedset}
+    cls.regions = {'definedset': definedset}
 
-    for nregions in [pow(10, n) for n in range(1, 4)]:
+    for nregions in [pow(10, n) for n in range(1, 4 if RUN_LARGE_TESTS else 3)]:
       for sizepc in [0.01, 0.05, *([] if nregions > 100 else [0.1])]:
         sizerng = Region([0]*2, [sizepc]*2)
-        regions = RegionSet.from_random(nregions, bounds, sizepc=sizerng, precision=1)
-        self.regions[f'{nregions},{sizepc:.2f}'] = regions
+        regions = RegionSet.from_random(nregions, bounds, sizepc=sizerng, precision=1, seed=0)
+        cls.regions[f'{nregions},{sizepc:.2f}'] = regions
 
   def run_evaluator(self, name: str, clazz: SweepTaskRunner):
     regions = self.regions[name]
@@ -10,6 +10,7 @@ Unit tests for Interval Data Class
 - test_interval_contains
 - test_interval_overlaps
 - test_interval_intersect
+- test_interval_overlap_bounds
 - test_interval_union
 - test_interval_random_values
 - test_interval_random_intervals
@@ -20,29 +21,47 @@ Unit tests for Interval Data Class
 """
 
 from dataclasses import asdict, astuple
-from typing import List
+from typing import Dict, List, Tuple
 from unittest import TestCase
 
-from numpy import mean
+from numpy import array, maximum, minimum, ndarray as NDArray
 
 from sources.core import Interval
 
 
 class TestInterval(TestCase):
 
+  test_texts: List[Tuple[str, str]] = [
+    ('[10.5,20]', 'json'),
+    ('[10.5,20]', 'literal'),
+    ('(10.5,20)', 'literal'),
+    ('{"lower":10.5,"upper":20}', 'json'),
+    ('{"lower":10.5,"upper":20}', 'literal'),
+    ("{'lower':10.5,'upper':20}", 'literal')
+  ]
+  test_interval: Interval
   test_intervals: List[Interval]
+  lowers: NDArray
+  uppers: NDArray
+  conversions: List[Tuple[Dict[str, float], Tuple[float, float]]]
   overlaps: List[List[bool]]
 
-  def setUp(self):
-    self.test_intervals = []
-    self.test_intervals.append(Interval(-10, 25))
-    self.test_intervals.append(Interval(10.5, 45))
-    self.test_intervals.append(Interval(-10.5, 45))
-    self.test_intervals.append(Interval(10.5, -45))
-    self.test_intervals.append(Interval(-10.5, -45))
-    self.test_intervals.append(Interval(5, 5))
-    self.test_intervals.append(Interval(5, 6))
-    self.overlaps = [
+  @classmethod
+  def setUpClass(cls):
+    cls.test_interval = Interval(-5, 15)
+    cls.test_intervals = []
+    cls.test_intervals.append(Interval(-10, 25))
+    cls.test_intervals.append(Interval(10.5, 45))
+    cls.test_intervals.append(Interval(-10.5, 45))
+    cls.test_intervals.append(Interval(10.5, -45))
+    cls.test_intervals.append(Interval(-10.5, -45))
+    cls.test_intervals.append(Interval(5, 5))
+    cls.test_intervals.append(Interval(5, 6))
+    cls.lowers = array([interval.lower for interval in cls.test_intervals])
+    cls.uppers = array([interval.upper for interval in cls.test_intervals])
+    cls.conversions = [({'lower': interval.lower, 'upper': interval.upper},
+                        (interval.lower, interval.upper)) for interval in cls.test_intervals]
+    cls.overlaps = [
       [True,  True,  True,  True,  False, True,  True],
       [True,  True,  True,  False, False, False, False],
       [True,  True,  True,  True,  False, True,  True],
@@ -69,13 +88,13 @@ class TestInterval(TestCase):
     for interval in self.test_intervals:
       #print(f'{interval}: length={interval.length} midpoint={interval.midpoint}')
       self.assertEqual(interval.length, interval.upper - interval.lower)
-      self.assertEqual(interval.midpoint, mean([interval.lower, interval.upper]))
+      self.assertEqual(interval.midpoint, (interval.lower + interval.upper) / 2)
 
   def test_interval_conversion(self):
-    for interval in self.test_intervals:
+    for interval, (expect_dict, expect_tuple) in zip(self.test_intervals, self.conversions):
       #print(f'{interval}: dict={asdict(interval)}, tuple={astuple(interval)}')
-      self.assertEqual(asdict(interval), {'lower': interval.lower, 'upper': interval.upper})
-      self.assertEqual(astuple(interval), (interval.lower, interval.upper))
+      self.assertEqual(asdict(interval), expect_dict)
+      self.assertEqual(astuple(interval), expect_tuple)
 
   def test_interval_hash(self):
     intervals = {}
@@ -89,7 +108,7 @@ class TestInterval(TestCase):
       self.assertTrue(hash(interval) == hash(other))
 
   def test_interval_contains(self):
-    interval = Interval(-5, 15)
+    interval = self.test_interval
     self.assertTrue(interval.lower in interval)
     self.assertTrue(interval.upper in interval)
     self.assertTrue(interval.midpoint in interval)
@@ -116,19 +135,25 @@ class TestInterval(TestCase):
       self.assertEqual(subinterval in interval, comparsion)
 
   def test_interval_overlaps(self):
-    for i, first in enumerate(self.test_intervals):
-      for j, second in enumerate(self.test_intervals):
-        #print(f'{first} and {second}: expect={self.overlaps[i][j]}, actual={first.overlaps(second)}')
-        self.assertEqual(first.overlaps(second), self.overlaps[i][j])
+    l1, u1 = self.lowers[:, None], self.uppers[:, None]
+    l2, u2 = self.lowers[None, :], self.uppers[None, :]
+    expected = ((l1 < u2) & (l2 < u1)) | ((l1 == l2) & (u1 == u2))
+    self.assertListEqual(expected.tolist(), self.overlaps)
+
+    actual = [[first.overlaps(second) for second in self.test_intervals]
+                                      for first in self.test_intervals]
+    #print(f'expect={self.overlaps}, actual={actual}')
+    self.assertListEqual(actual, self.overlaps)
 
   def test_interval_intersect(self):
+    lowers = maximum.outer(self.lowers, self.lowers).tolist()
+    uppers = minimum.outer(self.uppers, self.uppers).tolist()
+
     for i, first in enumerate(self.test_intervals):
       for j, second in enumerate(self.test_intervals):
         intersect = first.intersect(second)
         if self.overlaps[i][j]:
-          expected = first if first == second \
-                           else Interval(max(first.lower, second.lower),
-                                         min(first.upper, second.upper))
+          expected = Interval(lowers[i][j], uppers[i][j])
 
           #print(f'{first} and {second}:')
           #print(f'  expect={expected}')
@@ -141,6 +166,18 @@ class TestInterval(TestCase):
           #print(f'  actual={intersect}')
           self.assertEqual(intersect, None)
 
+  def test_interval_overlap_bounds(self):
+    lowers = maximum.outer(self.lowers, self.lowers).tolist()
+    uppers = minimum.outer(self.uppers, self.uppers).tolist()
+
+    for i, first in enumerate(self.test_intervals):
+      for j, second in enumerate(self.test_intervals):
+        bounds = first.overlap_bounds(second)
+        if self.overlaps[i][j]:
+          self.assertEqual(bounds, (lowers[i][j], uppers[i][j]))
+        else:
+          self.assertIsNone(bounds)
+
   def test_interval_union(self):
     for first in self.test_intervals:
       for second in self.test_intervals:
@@ -152,7 +189,7 @@ class TestInterval(TestCase):
         self.assertTrue(second in union)
 
   def test_interval_random_values(self):
-    interval = Interval(-5, 15)
+    interval = self.test_interval
     randoms = interval.random_values(5)
     #print(f'{interval}:')
     for value in randoms:
@@ -160,7 +197,7 @@ class TestInterval(TestCase):
       self.assertTrue(interval.contains(value, inc_upper=False))
 
   def test_interval_random_interval(self):
-    interval = Interval(-5, 15)
+    interval = self.test_interval
     randoms  = interval.random_intervals(5, Interval(0.25, 0.75))
     randoms += interval.random_intervals(5, Interval(0.25, 0.75), precision=0)
     #print(f'{interval}:')
@@ -200,15 +237,7 @@ class TestInterval(TestCase):
 
   def test_interval_from_text(self):
     test_interval = Interval(10.5, 20)
-    texts = []
-    texts.append(('[10.5,20]', 'json'))
-    texts.append(('[10.5,20]', 'literal'))
-    texts.append(('(10.5,20)', 'literal'))
-    texts.append(('{"lower":10.5,"upper":20}', 'json'))
-    texts.append(('{"lower":10.5,"upper":20}', 'literal'))
-    texts.append(("{'lower':10.5,'upper':20}", 'literal'))
-
-    for text in texts:
+    for text in self.test_texts:
       #print(f'text="{text[0]}"' if "'" in text else f"text='{text[0]}'")
       #print(f'format={text[1]}')
       self.assertEqual(test_interval, Interval.from_text(*text))
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for Interval Index
+
+- test_create_intervalindex
+- test_intervalindex_overlapping
+- test_intervalindex_random_overlapping
+- test_intervalindex_from_bounds
+"""
+
+from typing import List
+from unittest import TestCase
+
+from sources.core import Interval, IntervalIndex
+from sources.helpers import Randoms
+
+
+class TestIntervalIndex(TestCase):
+
+  test_intervals: List[Interval]
+
+  def setUp(self):
+    self.test_intervals = []
+    self.test_intervals.append(Interval(-10, 25))
+    self.test_intervals.append(Interval(10.5, 45))
+    self.test_intervals.append(Interval(-10.5, 45))
+    self.test_intervals.append(Interval(10.5, -45))
+    self.test_intervals.append(Interval(-10.5, -45))
+    self.test_intervals.append(Interval(5, 5))
+    self.test_intervals.append(Interval(5, 6))
+
+  def _test_overlapping(self, index: IntervalIndex, intervals: List[Interval], query: Interval):
+    expected = [i for i in intervals if i.overlaps(query)]
+    actual = list(index.overlapping(query))
+    self.assertEqual(len(expected), len(actual))
+    for interval in expected:
+      self.assertTrue(any([interval is i for i in actual]))
+
+  def test_create_intervalindex(self):
+    index = IntervalIndex.from_intervals(self.test_intervals)
+    self.assertEqual(len(self.test_intervals), len(index))
+    self.assertListEqual(sorted(i.lower for i in self.test_intervals), index.lowers.tolist())
+    for k in range(len(index)):
+      self.assertEqual(index.maxuppers[k], max(index.uppers[0:k+1]))
+
+  def test_intervalindex_overlapping(self):
+    index = IntervalIndex.from_intervals(self.test_intervals)
+    for query in self.test_intervals + [Interval(-50, -45), Interval(45, 50), Interval(6, 10.5)]:
+      self._test_overlapping(index, self.test_intervals, query)
+
+  def test_intervalindex_random_overlapping(self):
+    bounds = Interval(-5, 15)
+    randomng = Randoms.seeded(0).uniform()
+    intervals = bounds.random_intervals(200, Interval(0, 0.2), randomng, randomng, precision=0)
+    index = IntervalIndex.from_intervals(intervals)
+    for query in bounds.random_intervals(50, Interval(0, 0.3), randomng, randomng, precision=0):
+      self._test_overlapping(index, intervals, query)
+
+  def test_intervalindex_from_bounds(self):
+    lowers = [i.lower for i in self.test_intervals]
+    uppers = [i.upper for i in self.test_intervals]
+    index = IntervalIndex.from_bounds(lowers, uppers)
+    self.assertEqual(len(self.test_intervals), len(index))
+    self.assertIsNone(index.intervals)
+    for query in self.test_intervals + [Interval(-50, -45), Interval(45, 50), Interval(6, 10.5)]:
+      expected = [k for k, i in enumerate(self.test_intervals) if i.overlaps(query)]
+      actual = index.overlapping_order(query.lower, query.upper)
+      self.assertListEqual(sorted(actual.tolist()), expected)
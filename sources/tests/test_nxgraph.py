@@ -14,6 +14,8 @@ from io import StringIO
 from typing import List, Tuple
 from unittest import TestCase
 
+from numpy import array, array_equal, ndarray as NDArray
+
 from sources.algorithms.rigctor import NxGraphMdSweepCtor, NxGraphSweepCtor
 from sources.algorithms.sweepln import RegionSweep, RegionSweepDebug
 from sources.core import \
@@ -23,14 +25,20 @@ from sources.core import \
 class TestNxGraph(TestCase):
 
   test_regions: List[Region]
-
-  def setUp(self):
-    self.test_regions = []
-    self.test_regions.append(Region([0, 0], [5, 5]))
-    self.test_regions.append(Region([2, 2], [5, 10]))
-    self.test_regions.append(Region([1, 5], [3, 7]))
-    self.test_regions.append(Region([-5, 5], [1, 7]))
-    self.test_regions.append(Region([-5, 5], [2, 7]))
+  dimension: int
+  regionset: RegionSet
+
+  @classmethod
+  def setUpClass(cls):
+    cls.test_regions = []
+    cls.test_regions.append(Region([0, 0], [5, 5]))
+    cls.test_regions.append(Region([2, 2], [5, 10]))
+    cls.test_regions.append(Region([1, 5], [3, 7]))
+    cls.test_regions.append(Region([-5, 5], [1, 7]))
+    cls.test_regions.append(Region([-5, 5], [2, 7]))
+    cls.dimension = cls.test_regions[0].dimension
+    cls.regionset = RegionSet(dimension=cls.dimension)
+    cls.regionset.streamadd(cls.test_regions)
 
   def _reset_output(self, output: StringIO) -> StringIO:
     output.seek(0)
@@ -55,87 +63,72 @@ class TestNxGraph(TestCase):
         if region.overlaps(that):
           nxgraph.put_overlap((region, that))
 
+  def _regions_asarray(self, regions: List[Region]) -> Tuple[NDArray, NDArray]:
+    self.assertTrue(all(isinstance(r, Region) for r in regions))
+    return array([r.lower for r in regions]), array([r.upper for r in regions])
+
+  def _check_regions(self, aregions: List[Region], bregions: List[Region]):
+    alowers, auppers = self._regions_asarray(aregions)
+    blowers, buppers = self._regions_asarray(bregions)
+    self.assertTrue(array_equal(alowers, blowers) and array_equal(auppers, buppers))
+
   def _check_nxgraph(self, a: NxGraph, b: NxGraph):
     self.assertEqual(a.dimension, b.dimension)
-    for anode, aregion in a.G.nodes(data='region'):
-      self.assertTrue(anode in b.G.node)
-      self.assertTrue(isinstance(aregion, Region))
-      self.assertTrue(isinstance(b.G.node[anode]['region'], Region))
-      self.assertEqual(aregion, b.G.node[anode]['region'])
+    nodes = list(a.G.nodes)
+    self.assertTrue(all(node in b.G.node for node in nodes))
+    self._check_regions([a.G.node[node]['region'] for node in nodes],
+                        [b.G.node[node]['region'] for node in nodes])
+
+    edges = list(a.G.edges)
+    self.assertTrue(all(edge in b.G.edges for edge in edges))
+    self._check_regions([a.G.edges[edge]['intersect'] for edge in edges],
+                        [b.G.edges[edge]['intersect'] for edge in edges])
 
     for (u, v, aregion) in a.G.edges(data='intersect'):
-      self.assertTrue((u, v) in b.G.edges)
       bregion = b.G.edges[u, v]['intersect']
       #print(f'A: {aregion}: {aregion["intersect"]}')
       #print(f'B: {bregion}: {bregion["intersect"]}')
-      self.assertTrue(isinstance(aregion, Region))
-      self.assertTrue(isinstance(bregion, Region))
-      self.assertEqual(aregion, bregion)
       if 'intersect' in aregion:
         self.assertTrue('intersect' in bregion)
-        self.assertTrue(all([isinstance(r, Region) for r in aregion['intersect']]))
-        self.assertTrue(all([isinstance(r, Region) for r in bregion['intersect']]))
-        self.assertTrue(all([r in bregion['intersect'] for r in aregion['intersect']]))
-
-  def test_nxgraph_create(self):
-    dimension = self.test_regions[0].dimension
-    nxgraph = NxGraph(dimension=dimension)
-    self._naive_ctor(nxgraph)
+        self.assertTrue(all(isinstance(r, Region) for r in aregion['intersect']))
+        self.assertTrue(all(isinstance(r, Region) for r in bregion['intersect']))
+        bintersect = set([r.id for r in bregion['intersect']])
+        self.assertTrue(all(r.id in bintersect for r in aregion['intersect']))
 
+  def _check_roundtrip(self, nxgraph: NxGraph):
     with StringIO() as output:
       for json_graph in ['node_link', 'adjacency']:
         options = { 'json_graph': json_graph, 'compact': True }
         output.truncate(0)
-        NxGraph.to_output(nxgraph, self._reset_output(output), options=options)
+        NxGraph.to_output(nxgraph, self._reset_output(output), options=options, indent=None)
         #json_output = output.getvalue()
         #print(f'{json_graph}:')
         #print(f'{json_output}')
         newgraph = NxGraph.from_source(self._reset_output(output))
         self._check_nxgraph(nxgraph, newgraph)
 
+  def test_nxgraph_create(self):
+    nxgraph = NxGraph(dimension=self.dimension)
+    self._naive_ctor(nxgraph)
+
+    self._check_roundtrip(nxgraph)
+
   def test_nxgraph_sweepctor(self):
-    dimension = self.test_regions[0].dimension
-    regionset = RegionSet(dimension=dimension)
-    regionset.streamadd(self.test_regions)
-    nxgraph = self._nxgraphctor(regionset)
+    nxgraph = self._nxgraphctor(self.regionset)
 
-    with StringIO() as output:
-      for json_graph in ['node_link', 'adjacency']:
-        options = { 'json_graph': json_graph, 'compact': True }
-        output.truncate(0)
-        NxGraph.to_output(nxgraph, self._reset_output(output), options=options)
-        #json_output = output.getvalue()
-        #print(f'{json_graph}:')
-        #print(f'{json_output}')
-        newgraph = NxGraph.from_source(self._reset_output(output))
-        self._check_nxgraph(nxgraph, newgraph)
+    self._check_roundtrip(nxgraph)
 
   def test_nxgraph_mdsweepctor(self):
-    dimension = self.test_regions[0].dimension
-    regionset = RegionSet(dimension=dimension)
-    regionset.streamadd(self.test_regions)
-    nxgraph = self._nxgraphmdctor(regionset)
+    nxgraph = self._nxgraphmdctor(self.regionset)
 
-    with StringIO() as output:
-      for json_graph in ['node_link', 'adjacency']:
-        options = { 'json_graph': json_graph, 'compact': True }
-        output.truncate(0)
-        NxGraph.to_output(nxgraph, self._reset_output(output), options=options)
-        #json_output = output.getvalue()
-        #print(f'{json_graph}:')
-        #print(f'{json_output}')
-        newgraph = NxGraph.from_source(self._reset_output(output))
-        self._check_nxgraph(nxgraph, newgraph)
+    self._check_roundtrip(nxgraph)
 
   def test_nxgraph_sweepctor_graph(self):
-    dimension = self.test_regions[0].dimension
-    nxgraph = NxGraph(dimension=dimension)
+    nxgraph = NxGraph(dimension=self.dimension)
     self._naive_ctor(nxgraph)
 
-    regionset = RegionSet(dimension=dimension)
-    regionset.streamadd(self.test_regions)
-    nxgraphsweepln   = self._nxgraphctor(regionset)
-    nxgraphmdsweepln = self._nxgraphmdctor(regionset)
+    nxgraphsweepln   = self._nxgraphctor(self.regionset)
+    nxgraphmdsweepln = self._nxgraphmdctor(self.regionset)
 
     G = nxgraph.G
     S = nxgraphsweepln.G
@@ -156,8 +149,8 @@ class TestNxGraph(TestCase):
         self.assertTrue('intersect' in aregion)
         self.assertTrue('intersect' in bregion)
         aintersect = aregion['intersect']
-        bintersect = bregion['intersect']
-        self.assertTrue(all([r in bintersect for r in aintersect]))
+        bintersect = set([r.id for r in bregion['intersect']])
+        self.assertTrue(all(r.id in bintersect for r in aintersect))
 
   def test_nxgraph_sweepctor_random(self):
     regions = RegionSet.from_random(100, Region([0]*3, [100]*3))
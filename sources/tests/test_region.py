@@ -8,9 +8,12 @@ Unit tests for Region Data Class
 - test_region_properties
 - test_region_getsetitem
 - test_region_contains
+- test_region_contains_many
+- test_region_encloses_many
 - test_region_equality
-- test_region_overlaps
-- test_region_intersect
+- test_region_overlaps_many
+- test_region_overlaps_intersect
+- test_region_intersect_many
 - test_region_union
 - test_region_linked_intersect
 - test_region_linked_union
@@ -28,39 +31,90 @@ Unit tests for Region Data Class
 
 from dataclasses import asdict, astuple
 from functools import reduce
-from typing import List, Tuple
+from itertools import accumulate
+from operator import mul
+from typing import Dict, List, Tuple, Union
 from unittest import TestCase
 
-from numpy import mean
-
 from sources.core import Interval, Region
+from sources.helpers import Randoms
 
 
 class TestRegion(TestCase):
 
+  test_dicts: List[Dict] = [
+    {"lower": [10]*3, "upper": [50]*3},
+    {"dimension": 3, "lower": 10, "upper": [50]*3},
+    {"dimension": 3, "lower": 10, "upper": 50},
+    {"dimension": 3, "lower": [10]*3, "upper": 50},
+    {"dimension": 3, "interval": [10, 50]},
+    {"dimension": 3, "interval": (10, 50)},
+    {"dimension": 3, "interval": {"lower": 10, "upper": 50}},
+    {"dimensions": [[10, 50]]*3},
+    {"dimensions": [(10, 50)]*3},
+    {"dimensions": [{"lower": 10, "upper": 50}]*3}
+  ]
+  test_objects: List[Union[List, Tuple]] = [
+    [[10, 50]]*3,
+    [(10, 50)]*3,
+    [{"lower": 10, "upper": 50}]*3,
+    (3, [10, 50]),
+    (3, (10, 50)),
+    (3, {"lower": 10, "upper": 50})
+  ]
+  test_texts: List[Tuple[str, str]] = [
+    ('{"lower": [10,10,10], "upper": [50,50,50]}', 'json'),
+    ('{"dimension": 3, "lower": 10, "upper": 50}', 'literal'),
+    ('{"dimension": 3, "lower": 10, "upper": 50}', 'json'),
+    ('{"dimension": 3, "interval": [10, 50]}', 'json'),
+    ('{"dimension": 3, "interval": [10, 50]}', 'literal'),
+    ('{"dimension": 3, "interval": (10, 50)}', 'literal'),
+    ('[[10, 50],[10, 50],[10, 50]]', 'json'),
+    ('[[10, 50],[10, 50],[10, 50]]', 'literal'),
+    ('[(10, 50),(10, 50),(10, 50)]', 'literal'),
+    ('[{"lower": 10, "upper": 50},{"lower": 10, "upper": 50},{"lower": 10, "upper": 50}]', 'json'),
+    ('[{"lower": 10, "upper": 50},{"lower": 10, "upper": 50},{"lower": 10, "upper": 50}]', 'literal'),
+    ('(3, [10, 50])', 'literal'),
+    ('(3, (10, 50))', 'literal')
+  ]
   test_regions: List[Region]
   overlaps: List[List[bool]]
-
-  def setUp(self):
-    self.test_regions = []
-    self.test_regions.append(Region([0, 0], [5, 5]))
-    self.test_regions.append(Region([2, 2], [5, 10]))
-    self.test_regions.append(Region([1, 5], [3, 7]))
-    self.test_regions.append(Region([-5, 5], [1, 7]))
-    self.test_regions.append(Region([-5, 5], [2, 7]))
-    self.overlaps = [
+  test_region: Region
+  intersect_regions: List[Region]
+  expected_intersects: List[Region]
+  union_bounds: Region
+  union_regions: List[Region]
+  expected_union: Region
+
+  @classmethod
+  def setUpClass(cls):
+    cls.test_region = Region([10]*3, [50]*3)
+    cls.test_regions = []
+    cls.test_regions.append(Region([0, 0], [5, 5]))
+    cls.test_regions.append(Region([2, 2], [5, 10]))
+    cls.test_regions.append(Region([1, 5], [3, 7]))
+    cls.test_regions.append(Region([-5, 5], [1, 7]))
+    cls.test_regions.append(Region([-5, 5], [2, 7]))
+    cls.overlaps = [
       [True,  True,  False, False, False], #  [0, 0], [5, 5]
       [True,  True,  True,  False, False], #  [2, 2], [5, 10]
       [False, True,  True,  False, True],  #  [1, 5], [3, 7]
       [False, False, False, True,  True],  # [-5, 5], [1, 7]
       [False, False, True,  True,  True]   # [-5, 5], [2, 7]
     ]
+    cls.intersect_regions = [Region([-i]*2, [i]*2) for i in range(5, 1, -1)]
+    cls.expected_intersects = list(accumulate(cls.intersect_regions,
+                                              lambda a, b: a.intersect(b, 'aggregate')))
+    cls.union_bounds = Region([0]*2, [100]*2)
+    cls.union_regions = cls.union_bounds.random_regions(5, Region([0.1]*2, [0.25]*2), precision = 0)
+    cls.expected_union = reduce(lambda a, b: a.union(b, 'aggregate'), cls.union_regions)
 
   def test_create_region(self):
     test_regions = []
     test_regions.append(Region([0], [5]))
     test_regions.append(Region([0, 0], [5, 5]))
     test_regions.append(Region([0, 5, 0], [5, 0, 5]))
+    interval = Interval(0, 5)
 
     for i, region in enumerate(test_regions):
       #print(region)
@@ -68,13 +122,18 @@ class TestRegion(TestCase):
       self.assertEqual(region.dimension, len(region.dimensions))
       self.assertEqual(region.dimension, len(region.lower))
       self.assertEqual(region.dimension, len(region.upper))
-      self.assertTrue(all([d == Interval(0,5) for d in region.dimensions]))
+      self.assertTrue(all([d == interval for d in region.dimensions]))
       self.assertTrue(all([d == 0 for d in region.lower]))
       self.assertTrue(all([d == 5 for d in region.upper]))
-      self.assertTrue(all([region.lower[i] <= region.upper[i] for i in range(region.dimension)]))
+      self.assertTrue(all(lower <= upper for lower, upper in zip(region.lower, region.upper)))
       self.assertTrue(all([region.lower[i] == region[i].lower for i in range(region.dimension)]))
       self.assertTrue(all([region.upper[i] == region[i].upper for i in range(region.dimension)]))
 
+    self.assertEqual(len(set([r.id for r in test_regions])), len(test_regions))
+    self.assertTrue(all(len(r.id) == 36 for r in test_regions))
+    self.assertEqual(Region([0], [5], 'A').id, 'A')
+    self.assertEqual(len(Region.new_uuid()), 36)
+
   def test_region_dimension_mismatch(self):
     with self.assertRaises(AssertionError):
       Region([0, 0], [10, 10], dimension=3)
@@ -90,10 +149,10 @@ class TestRegion(TestCase):
       #  f'midpoint={region.midpoint}',
       #  f'size={region.size}'
       #]))
-      self.assertEqual(region.dimensions, [Interval(region.lower[i], region.upper[i]) for i in range(region.dimension)])
+      self.assertEqual(list(region.dimensions), [Interval(region.lower[i], region.upper[i]) for i in range(region.dimension)])
       self.assertEqual(region.lengths, [d.upper - d.lower for d in region.dimensions])
-      self.assertEqual(region.midpoint, [mean([d.lower, d.upper]) for d in region.dimensions])
-      self.assertEqual(region.size, reduce(lambda x, y: x*y, region.lengths))
+      self.assertEqual(region.midpoint, [(d.lower + d.upper) / 2 for d in region.dimensions])
+      self.assertEqual(region.size, reduce(mul, region.lengths))
 
   def test_region_getsetitem(self):
     data = {'data': 'value', 'datalist': ['list', 'of', 'items'], 'dataprop': 'dataprop'}
@@ -104,6 +163,7 @@ class TestRegion(TestCase):
       self.assertTrue(all([region[i] == interval for i, interval in enumerate(intervals)]))
       self.assertEqual(list(map(lambda i: i.lower, intervals)), region.lower)
       self.assertEqual(list(map(lambda i: i.upper, intervals)), region.upper)
+      self.assertEqual(reduce(mul, [i.length for i in intervals]), region.size)
 
     check_region(region, intervals)
     #print(f'{region}')
@@ -113,6 +173,15 @@ class TestRegion(TestCase):
     for i, interval in enumerate(intervals): region[i] = interval
     check_region(region, intervals)
 
+    with self.assertRaises(Exception):
+      region[0].assign(-10, 20)
+    with self.assertRaises(Exception):
+      region.dimensions[1].assign(-10, 20)
+    with self.assertRaises(TypeError):
+      region.dimensions[2] = Interval(-10, 20)
+    intervals[0].assign(-10, 20)
+    check_region(region, [Interval(0, 10), Interval(0, 11), Interval(0, 12)])
+
     region['data'] = data['data']
     region['datalist'] = data['datalist']
     #print(f'{region}')
@@ -143,6 +212,16 @@ class TestRegion(TestCase):
     self.assertFalse([region.upper[0] + 0.1, region.upper[1]]       in region)
     self.assertFalse([region.upper[0]      , region.upper[1] + 0.1] in region)
 
+  def test_region_contains_many(self):
+    region = Region([-5, 0], [15, 10])
+    points = [region.lower, region.upper, region.midpoint,
+              [v - 0.1 for v in region.lower], [v + 0.1 for v in region.upper],
+              [region.lower[0] + 0.1, region.lower[1] - 0.1]]
+    for inc_lower in [True, False]:
+      for inc_upper in [True, False]:
+        expected = [region.contains(p, inc_lower, inc_upper) for p in points]
+        self.assertListEqual(region.contains_many(points, inc_lower, inc_upper).tolist(), expected)
+
   def test_region_encloses(self):
     region = Region([-5, 5], [0, 10])
     test_regions = []
@@ -153,14 +232,24 @@ class TestRegion(TestCase):
     test_regions.append(Region([-6, 5], [0, 10]))
     test_regions.append(Region([-2, 7], [-2, 7]))
 
+    lower, upper = region.lower, region.upper
     for subregion in test_regions:
-      comparsion = all([region.lower[i] <= subregion.lower[i] <= subregion.upper[i] <= region.upper[i] for i in
-                        range(region.dimension)])
+      comparsion = all(a <= b <= c <= d for a, b, c, d in
+                       zip(lower, subregion.lower, subregion.upper, upper))
       #print(f'{subregion} in\n{region}:')
       #print(f'  expect={comparsion}')
       #print(f'  actual={subregion in region}')
       self.assertEqual(subregion in region, comparsion)
 
+  def test_region_encloses_many(self):
+    lowers = [region.lower for region in self.test_regions]
+    uppers = [region.upper for region in self.test_regions]
+    for first in self.test_regions:
+      for inc_lower in [True, False]:
+        for inc_upper in [True, False]:
+          expected = [first.encloses(second, inc_lower, inc_upper) for second in self.test_regions]
+          self.assertListEqual(first.encloses_many(lowers, uppers, inc_lower, inc_upper).tolist(), expected)
+
   def test_region_equality(self):
     test_regions = []
     test_regions.append(Region([-5, 0], [15, 10]))
@@ -172,37 +261,47 @@ class TestRegion(TestCase):
 
     for region in test_regions:
       self.assertNotEqual(region.id, match_region.id)
-      if all([region.lower[i] == match_region.lower[i] and \
-              region.upper[i] == match_region.upper[i] for i in range(match_region.dimension)]):
+      if region.lower == match_region.lower and region.upper == match_region.upper:
         self.assertListEqual(region.lower, match_region.lower)
         self.assertListEqual(region.upper, match_region.upper)
         self.assertEqual(region, match_region)
 
-  def test_region_overlaps(self):
+  def test_region_overlaps_many(self):
+    lowers = [region.lower for region in self.test_regions]
+    uppers = [region.upper for region in self.test_regions]
     for i, first in enumerate(self.test_regions):
-      for j, second in enumerate(self.test_regions):
-        overlap = first.overlaps(second)
-        #print(f'{first}\n{second}:')
-        #print(f'  expect={self.overlaps[i][j]}')
-        #print(f'  actual={overlap}')
-        self.assertEqual(overlap, self.overlaps[i][j])
+      overlaps = first.overlaps_many(lowers, uppers)
+      self.assertListEqual(overlaps.tolist(), self.overlaps[i])
 
-  def test_region_intersect(self):
+  def test_region_overlaps_intersect(self):
     for i, first in enumerate(self.test_regions):
       for j, second in enumerate(self.test_regions):
-        intersect = first.intersect(second)
-        if self.overlaps[i][j]:
+        with self.subTest(i=i, j=j):
+          overlap = first.overlaps(second)
+          intersect = first.intersect(second)
           #print(f'{first}\n{second}:')
-          #print(f'  actual={intersect}')
-          #print(f'  size={intersect.size}')
-          for x, d in enumerate(first.dimensions):
-            self.assertEqual(d.intersect(second.dimensions[x]),
-                             intersect.dimensions[x])
-        else:
-          #print(f'{first}\n{second}:')
-          #print(f'  expect=None')
-          #print(f'  actual={intersect}')
-          self.assertEqual(intersect, None)
+          #print(f'  expect={self.overlaps[i][j]}')
+          #print(f'  actual={overlap}')
+          self.assertEqual(overlap, self.overlaps[i][j])
+          if overlap:
+            #print(f'  intersect={intersect}')
+            #print(f'  size={intersect.size}')
+            for x, d in enumerate(first.dimensions):
+              self.assertEqual(d.intersect(second.dimensions[x]),
+                               intersect.dimensions[x])
+          else:
+            self.assertIsNone(intersect)
+
+  def test_region_intersect_many(self):
+    lowers = [region.lower for region in self.test_regions]
+    uppers = [region.upper for region in self.test_regions]
+    for i, first in enumerate(self.test_regions):
+      overlaps, intx_lowers, intx_uppers = first.intersect_many(lowers, uppers)
+      expected = [first.intersect(second) for second in self.test_regions]
+      expected = [region for region in expected if region != None]
+      self.assertListEqual(overlaps.tolist(), self.overlaps[i])
+      self.assertListEqual(intx_lowers.tolist(), [region.lower for region in expected])
+      self.assertListEqual(intx_uppers.tolist(), [region.upper for region in expected])
 
   def test_region_union(self):
     for first in self.test_regions:
@@ -264,8 +363,9 @@ class TestRegion(TestCase):
   def test_region_random_points(self):
     region2d = Region([-5, 0], [15, 10])
     region3d = Region([-5, 0, 0], [15, 10, 50])
-    points2d = region2d.random_points(5)
-    points3d = region3d.random_points(5)
+    randomng = Randoms.seeded(0).uniform()
+    points2d = region2d.random_points(5, randomng)
+    points3d = region3d.random_points(5, randomng)
     #print(f'{region2d}: random={points2d}')
     #print(f'{region3d}: random={points3d}')
     for point in points2d:
@@ -275,12 +375,15 @@ class TestRegion(TestCase):
 
   def test_region_random_regions(self):
     region = Region([-5, 0], [15, 10])
-    randoms  = region.random_regions(5, Region([0.25, 0.25], [0.75, 0.75]))
-    randoms += region.random_regions(5, Region([0.25, 0.25], [0.75, 0.75]), precision = 0)
-    #print(f'{region}:')
-    for subregion in randoms:
-      #print(f'- {subregion}')
-      self.assertTrue(subregion in region)
+    sizepc = Region([0.25, 0.25], [0.75, 0.75])
+    for precision in [None, 0]:
+      with self.subTest(precision=precision):
+        randomng = Randoms.seeded(0).uniform()
+        randoms = region.random_regions(5, sizepc, randomng, randomng, precision = precision)
+        #print(f'{region}:')
+        for subregion in randoms:
+          #print(f'- {subregion}')
+          self.assertTrue(subregion in region)
 
   def test_region_from_intervals(self):
     ndimens = 5
@@ -306,9 +409,9 @@ class TestRegion(TestCase):
         self.assertEqual(dimen, interval)
 
   def test_region_from_intersect(self):
-    regions = [Region([-i]*2, [i]*2) for i in range(5, 1, -1)]
+    regions = self.intersect_regions
     for i in range(1, len(regions)):
-      expected_intersect = reduce(lambda a, b: a.intersect(b, 'aggregate'), regions[0:i+1])
+      expected_intersect = self.expected_intersects[i]
       intersect = Region.from_intersect(regions[0:i+1], True)
       #print(f'Expected: {expected_intersect}')
       #print(f'Expected["intersect"]: {expected_intersect["intersect"]}')
@@ -320,9 +423,9 @@ class TestRegion(TestCase):
       self.assertListEqual(expected_intersect['intersect'], intersect['intersect'])
 
   def test_region_from_union(self):
-    region = Region([0]*2, [100]*2)
-    regions = region.random_regions(5, Region([0.1]*2, [0.25]*2), precision = 0)
-    expected_union = reduce(lambda a, b: a.union(b, 'aggregate'), regions)
+    region = self.union_bounds
+    regions = self.union_regions
+    expected_union = self.expected_union
     union = Region.from_union(regions, True)
     #print(f'Expected: {expected_union}')
     #print(f'Actual: {union}')
@@ -334,65 +437,24 @@ class TestRegion(TestCase):
     self.assertTrue(region.encloses(union))
 
   def test_region_from_dict(self):
-    test_region = Region([10]*3, [50]*3)
-    objects = []
-    objects.append({"lower": [10]*3, "upper": [50]*3})
-    objects.append({"dimension": 3, "lower": 10, "upper": [50]*3})
-    objects.append({"dimension": 3, "lower": 10, "upper": 50})
-    objects.append({"dimension": 3, "lower": [10]*3, "upper": 50})
-    objects.append({"dimension": 3, "interval": [10, 50]})
-    objects.append({"dimension": 3, "interval": (10, 50)})
-    objects.append({"dimension": 3, "interval": {"lower": 10, "upper": 50}})
-    objects.append({"dimensions": [[10, 50]]*3})
-    objects.append({"dimensions": [(10, 50)]*3})
-    objects.append({"dimensions": [{"lower": 10, "upper": 50}]*3})
-
-    for object in objects:
+    test_region = self.test_region
+    for object in self.test_dicts:
       #print(f'{object}')
-      self.assertEqual(test_region, Region.from_dict(object))
+      with self.subTest(object=object):
+        # copied, since from_dict expands scalar bounds in-place
+        self.assertEqual(test_region, Region.from_dict(dict(object)))
 
   def test_region_from_object(self):
-    test_region = Region([10]*3, [50]*3)
-    objects = []
-    objects.append({"lower": [10]*3, "upper": [50]*3})
-    objects.append({"dimension": 3, "lower": 10, "upper": [50]*3})
-    objects.append({"dimension": 3, "lower": 10, "upper": 50})
-    objects.append({"dimension": 3, "lower": [10]*3, "upper": 50})
-    objects.append({"dimension": 3, "interval": [10, 50]})
-    objects.append({"dimension": 3, "interval": (10, 50)})
-    objects.append({"dimension": 3, "interval": {"lower": 10, "upper": 50}})
-    objects.append({"dimensions": [[10, 50]]*3})
-    objects.append({"dimensions": [(10, 50)]*3})
-    objects.append({"dimensions": [{"lower": 10, "upper": 50}]*3})
-    objects.append([[10, 50]]*3)
-    objects.append([(10, 50)]*3)
-    objects.append([{"lower": 10, "upper": 50}]*3)
-    objects.append((3, [10, 50]))
-    objects.append((3, (10, 50)))
-    objects.append((3, {"lower": 10, "upper": 50}))
-
-    for object in objects:
+    test_region = self.test_region
+    for object in [dict(object) for object in self.test_dicts] + self.test_objects:
       #print(f'{object}')
-      self.assertEqual(test_region, Region.from_object(object))
+      with self.subTest(object=object):
+        self.assertEqual(test_region, Region.from_object(object))
 
   def test_region_from_text(self):
-    test_region = Region([10]*3, [50]*3)
-    texts = []
-    texts.append(('{"lower": [10,10,10], "upper": [50,50,50]}', 'json'))
-    texts.append(('{"dimension": 3, "lower": 10, "upper": 50}', 'literal'))
-    texts.append(('{"dimension": 3, "lower": 10, "upper": 50}', 'json'))
-    texts.append(('{"dimension": 3, "interval": [10, 50]}', 'json'))
-    texts.append(('{"dimension": 3, "interval": [10, 50]}', 'literal'))
-    texts.append(('{"dimension": 3, "interval": (10, 50)}', 'literal'))
-    texts.append(('[[10, 50],[10, 50],[10, 50]]', 'json'))
-    texts.append(('[[10, 50],[10, 50],[10, 50]]', 'literal'))
-    texts.append(('[(10, 50),(10, 50),(10, 50)]', 'literal'))
-    texts.append(('[{"lower": 10, "upper": 50},{"lower": 10, "upper": 50},{"lower": 10, "upper": 50}]', 'json'))
-    texts.append(('[{"lower": 10, "upper": 50},{"lower": 10, "upper": 50},{"lower": 10, "upper": 50}]', 'literal'))
-    texts.append(('(3, [10, 50])', 'literal'))
-    texts.append(('(3, (10, 50))', 'literal'))
-
-    for text in texts:
+    test_region = self.test_region
+    for text in self.test_texts:
       #print(f'text="{text[0]}"' if "'" in text else f"text='{text[0]}'")
       #print(f'format={text[1]}')
-      self.assertEqual(test_region, Region.from_text(*text))
+      with self.subTest(text=text):
+        self.assertEqual(test_region, Region.from_text(*text))
@@ -7,19 +7,37 @@ Unit tests for Regions Collection
 - test_regionset_dimension_mismatch
 - test_regionset_outofbounds
 - test_regionset_iteration
+- test_regionset_extend
+- test_regionset_extend_bounds
 - test_regionset_from_random
+- test_regionset_generate
 - test_regionset_tofrom_output
 - test_regionset_tofrom_output_backlinks
+- test_regionset_reload_add
 - test_regionset_filter
 - test_regionset_subset
 - test_regionset_merge
+- test_regionset_overlap_matrix
+- test_regionset_sizes
+- test_regionset_pairwise_overlaps
+- test_regionset_overlap_pairs
+- test_regionset_query
+- test_regionset_query_stale
 """
 
 from io import StringIO
+from os import path
+from random import Random
+from subprocess import check_output
+from sys import executable
 from typing import Iterable, List
 from unittest import TestCase
 
-from sources.core import Region, RegionSet
+from numpy import empty
+from numpy.random import seed
+
+from sources.core import Interval, Region, RegionSet
+from sources.helpers import Randoms, SeededRandoms, to_base26
 
 
 class TestRegionSet(TestCase):
@@ -28,6 +46,7 @@ class TestRegionSet(TestCase):
     #print(f'{regionset}')
     self.assertEqual(regionset.length, nregions)
     self.assertTrue(bounds.encloses(regionset.minbounds))
+    self.assertEqual(regionset.minbounds, Region.from_union(regionset.regions))
     for i, region in enumerate(regions):
       #print(f'{region}')
       self.assertEqual(region, regionset[i])
@@ -72,12 +91,66 @@ class TestRegionSet(TestCase):
       self.assertIn(region, regionset)
       self.assertEqual(rid, region.id)
 
+  def test_regionset_extend(self):
+    nregions = 50
+    bounds = Region([0]*2, [10]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regions = RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=1)
+    regionset = RegionSet(bounds=bounds)
+    regionset.add(regions[0])
+    regionset.extend(regions.regions[1:])
+    self._test_regionset(regionset, nregions, bounds, regions)
+
+    with self.assertRaises(AssertionError):
+      regionset.extend([Region([5]*2, [15]*2)])
+    with self.assertRaises(AssertionError):
+      regionset.extend([Region([5]*3, [6]*3)])
+
+  def test_regionset_extend_bounds(self):
+    nregions = 50
+    bounds = Region([0]*2, [10]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regions = RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=1)
+    regionset = RegionSet(bounds=bounds)
+    regionset.extend_bounds([r.lower for r in regions], [r.upper for r in regions], list(regions.keys()))
+    self._test_regionset(regionset, nregions, bounds, regions)
+    for region in regions:
+      self.assertEqual(region, regionset[region.id])
+
+    with self.assertRaises(AssertionError):
+      regionset.extend_bounds([[5]*2], [[15]*2])
+    with self.assertRaises(AssertionError):
+      regionset.extend_bounds([[5]*3], [[6]*3])
+
   def test_regionset_from_random(self):
     nregions = 50
     bounds = Region([0]*2, [10]*2)
     sizepc = Region([0]*2, [0.5]*2)
     regionset = RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=1)
     self._test_regionset(regionset, nregions, bounds, regionset)
+    self.assertListEqual(list(regionset.keys()), [to_base26(n + 1) for n in range(nregions)])
+
+    seeded = [RegionSet.from_random(nregions, bounds, sizepc=sizepc, seed=0) for _ in range(2)]
+    self._test_regionset(seeded[0], nregions, bounds, seeded[1])
+
+  def test_regionset_generate(self):
+    nregions = 50
+    bounds = Region([0]*2, [10]*2)
+    regionset = RegionSet.generate(nregions, bounds)
+    self._test_regionset(regionset, nregions, bounds, regionset)
+
+    out = empty((nregions, 2, 2))
+    for randomng in [Randoms.uniform(), Randoms.parallel_uniform(2), SeededRandoms(0).uniform()]:
+      regionset = RegionSet.generate(nregions, bounds, randomng, out=out)
+      self._test_regionset(regionset, nregions, bounds, regionset)
+      self.assertListEqual(out[:, :, 0].tolist(), [r.lower for r in regionset])
+      self.assertListEqual(out[:, :, 1].tolist(), [r.upper for r in regionset])
+
+    seed(0)
+    expected = RegionSet.generate(nregions, bounds)
+    seed(0)
+    regionset = RegionSet.generate(nregions, bounds, out=out)
+    self._test_regionset(regionset, nregions, bounds, expected)
 
   def test_regionset_tofrom_output(self):
     nregions = 10
@@ -100,6 +173,26 @@ class TestRegionSet(TestCase):
       #print(after)
       self.assertEqual(before, after)
 
+    with StringIO() as output:
+      RegionSet.to_output(regionset, output)
+      output.seek(0)
+      newregionset = RegionSet.from_source(output, 'json')
+      self._test_regionset(newregionset, nregions, bounds, regionset)
+
+  def test_regionset_reload_add(self):
+    # saved by another process, with the default Region ids
+    script = 'import sys; from sources.core import Region, RegionSet; ' \
+             'regionset = RegionSet.from_random(200, Region([0]*2, [100]*2), base26_ids=False); ' \
+             'RegionSet.to_output(regionset, sys.stdout)'
+    root = path.dirname(path.dirname(path.dirname(path.abspath(__file__))))
+    saved = check_output([executable, '-c', script], cwd=root, text=True)
+
+    regionset = RegionSet.from_text(saved, 'json')
+    region = Region([1]*2, [2]*2)
+    regionset.add(region)
+    self.assertEqual(len(set(regionset.keys())), len(regionset))
+    self.assertIs(regionset[region.id], region)
+
   def test_regionset_tofrom_output_backlinks(self):
     nregions = 10
     bounds = Region([0]*2, [100]*2)
@@ -191,3 +284,104 @@ class TestRegionSet(TestCase):
 
     self.assertEqual(len(first) + len(second) + len(third), len(merged))
     self.assertEqual(len(regionkeys), len(set(regionkeys)))
+    for region in merged:
+      self.assertIs(merged.get(region.id), region)
+
+  def test_regionset_overlap_matrix(self):
+    nregions = 50
+    bounds = Region([0]*2, [10]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regionset = RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=0)
+    other = RegionSet.from_random(nregions // 2, bounds, sizepc=sizepc, precision=0)
+
+    for that in [regionset, other]:
+      overlaps = regionset.overlap_matrix(that)
+      self.assertEqual((len(regionset), len(that)), overlaps.shape)
+      for i, first in enumerate(regionset):
+        for j, second in enumerate(that):
+          self.assertEqual(first.overlaps(second), overlaps[i, j])
+
+  def test_regionset_sizes(self):
+    bounds = Region([0]*3, [10]*3)
+    regionset = RegionSet.from_random(50, bounds, sizepc=Region([0]*3, [0.5]*3), precision=1)
+    self.assertEqual(RegionSet(dimension=3).sizes.shape, (0,))
+    for region, size in zip(regionset, regionset.sizes.tolist()):
+      self.assertAlmostEqual(region.size, size)
+
+  def test_regionset_pairwise_overlaps(self):
+    nregions = 50
+    bounds = Region([0]*2, [10]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regionset = RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=1)
+    overlaps = regionset.overlap_matrix()
+
+    for tilesize in [1, 7, 16, 1024]:
+      for threads in [1, 4]:
+        self.assertTrue((overlaps == regionset.pairwise_overlaps(tilesize, threads)).all())
+        self.assertTrue((overlaps == regionset.overlap_matrix(None, tilesize, threads)).all())
+
+    self.assertTrue((overlaps == regionset.pairwise_overlaps(dtype='float32')).all())
+    self.assertTrue((overlaps == regionset.overlap_matrix(dtype='float32')).all())
+
+  def test_regionset_query(self):
+    nregions = 50
+    bounds = Region([0]*2, [10]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regionset = RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=0)
+    queries = bounds.random_regions(20, sizepc=sizepc, precision=0) + regionset.regions[0:5]
+
+    self.assertListEqual(RegionSet(dimension=2).query(bounds), [])
+    for query in queries:
+      expected = [region for region in regionset if query.overlaps(region)]
+      self.assertListEqual(regionset.query(query), expected)
+
+    added = Region([1]*2, [2]*2)
+    regionset.add(added)
+    self.assertIn(added, regionset.query(added))
+
+  def test_regionset_overlap_pairs(self):
+    nregions = 50
+    bounds = Region([0]*2, [10]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regionset = RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=1)
+    expected = [[i, j] for i, first in enumerate(regionset)
+                       for j, second in enumerate(regionset)
+                       if i < j and first.overlaps(second)]
+
+    self.assertEqual(RegionSet(dimension=2).overlap_pairs().shape, (0, 2))
+    for tilesize in [1, 7, 16, 1024]:
+      for threads in [1, 4]:
+        self.assertListEqual(regionset.overlap_pairs(tilesize, threads).tolist(), expected)
+
+    self.assertListEqual(regionset.overlap_pairs(dtype='float32').tolist(), expected)
+
+  def test_regionset_query_stale(self):
+    nregions = 50
+    bounds = Region([0]*2, [10]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regionset = RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=0, seed=0)
+    queries = RegionSet.from_random(20, bounds, sizepc=sizepc, precision=0, seed=1).regions
+
+    def check(regionset: RegionSet):
+      for query in queries:
+        expected = [region for region in regionset if query.overlaps(region)]
+        self.assertListEqual(regionset.query(query), expected)
+      for region, size in zip(regionset, regionset.sizes.tolist()):
+        self.assertAlmostEqual(region.size, size)
+      self.assertListEqual(regionset.overlap_pairs().tolist(),
+                           [[i, j] for i, first in enumerate(regionset)
+                                   for j, second in enumerate(regionset)
+                                   if i < j and first.overlaps(second)])
+
+    check(regionset)
+    shuffled = regionset.shuffle(Random(0).random)
+    with self.subTest(stale='shuffle'):
+      self.assertNotEqual(shuffled.regions, regionset.regions)
+      check(shuffled)
+    with self.subTest(stale='setitem'):
+      other = RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=0, seed=1)
+      other.sizes
+      shuffled[0][0] = Interval(0, 10)
+      self.assertFalse(other._stale)
+      check(shuffled)
+      check(regionset)
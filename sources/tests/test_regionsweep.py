@@ -7,7 +7,7 @@ Unit tests for Generalized One-Pass Sweep-line Algorithm
 - test_regionsweep_random
 """
 
-from typing import List
+from typing import List, Set, Tuple
 from unittest import TestCase
 
 from sources.algorithms import \
@@ -22,6 +22,9 @@ class TestRegionSweep(TestCase):
     subscribers = [] #[RegionSweepDebug()]
     return RegionSweepOverlaps.prepare(regions, *subscribers)(i)
 
+  def _pair_ids(self, pairs: List[RegionPair]) -> Set[Tuple[str, str]]:
+    return set([(a.id, b.id) for a, b in pairs])
+
   def test_regionsweep_simple(self):
     regionset = RegionSet(dimension=2)
     regionset.add(Region([0, 0], [3, 5]))
@@ -31,12 +34,13 @@ class TestRegionSweep(TestCase):
     for i in range(regionset.dimension):
       expect = regionset.overlaps(i)
       actual = self._evaluate_regionsweep(regionset, i)
+      actualids = self._pair_ids(actual)
       #for pair in expect: print(f'Expect {i}:\t{pair[0]}\n\t{pair[1]}')
       #for pair in actual: print(f'Actual {i}:\t{pair[0]}\n\t{pair[1]}')
       for pair in expect:
         #passed = "Passed" if pair in actual else "Failed"
         #print(f'{passed} {i}: {pair[0]} {pair[1]}')
-        self.assertTrue(pair in actual)
+        self.assertTrue((pair[0].id, pair[1].id) in actualids)
       self.assertEqual(len(expect), len(actual))
 
   def test_regionsweep_random(self):
@@ -47,16 +51,18 @@ class TestRegionSweep(TestCase):
       #print(f'Dimension: {i}')
       expect = regionset.overlaps(i)
       actual = self._evaluate_regionsweep(regionset, i)
+      actualids = self._pair_ids(actual)
       #for pair in expect: print(f'Expect {i}: {pair[0].id} {pair[1].id}')
       #for pair in actual: print(f'Actual {i}: {pair[0].id} {pair[1].id}')
       for pair in expect: 
         #passed = "Passed" if pair in actual else "Failed"
         #print(f'{passed} {i}: {pair[0].id} {pair[1].id}')
-        self.assertTrue(pair in actual)
+        self.assertTrue((pair[0].id, pair[1].id) in actualids)
       self.assertEqual(len(expect), len(actual))
       actuals.append(actual)
 
     self.assertTrue(all([len(actual) for actual in actuals]))
-    for pair in actuals[0]:
+    actualids = [self._pair_ids(actual) for actual in actuals]
+    for a, b in actualids[0]:
       for d in range(1, regionset.dimension):
-        self.assertTrue(pair in actuals[d] or (pair[1], pair[0]) in actuals[d])
+        self.assertTrue((a, b) in actualids[d] or (b, a) in actualids[d])
@@ -9,6 +9,7 @@ Unit tests for Restricted Enumeration of Region Intersections
 
 from inspect import stack
 from math import ceil
+from random import Random
 from time import perf_counter
 from typing import Dict, Iterator, List, NamedTuple, Tuple, Union
 from unittest import TestCase
@@ -16,6 +17,7 @@ from unittest import TestCase
 from sources.algorithms.queries import MRQEnum, RegionIntersect, SRQEnum
 from sources.algorithms.sweepln import RegionSweepDebug, SweepTaskRunner
 from sources.core import Region, RegionIntxn, RegionSet
+from sources.tests import RUN_LARGE_TESTS
 
 
 class TestRQEnumResult(NamedTuple):
@@ -29,7 +31,8 @@ class TestRQEnumerate(TestCase):
   regions: Dict[str, RegionSet]
   subsets: Dict[str, List[str]]
 
-  def setUp(self):
+  @classmethod
+  def setUpClass(cls):
     definedset = RegionSet(dimension=2)
     definedset.streamadd([
       Region([0, 0], [5, 5], 'A'),
@@ -42,27 +45,28 @@ class TestRQEnumerate(TestCase):
     ])
 
     bounds = Region([0]*2, [1000]*2)
+    random = Random(0).random
 
-    self.regions = {'definedset': definedset}
-    self.subsets = {'definedset': {'G1': ['A', 'C', 'E', 'G'],
+    cls.regions = {'definedset': definedset}
+    cls.subsets = {'definedset': {'G1': ['A', 'C', 'E', 'G'],
                                    'G2': ['B', 'D', 'F'],
                                    'G3': ['A', 'B', 'C', 'D']}}
 
-    for nregions in [pow(10, n) for n in range(1, 4)]:
+    for nregions in [pow(10, n) for n in range(1, 4 if RUN_LARGE_TESTS else 3)]:
       for sizepc in [0.01, 0.05, 0.1]:
         name = f'{nregions},{sizepc:.2f}'
         sizepcr = Region([0]*2, [sizepc]*2)
-        regions = RegionSet.from_random(nregions, bounds, sizepc=sizepcr, precision=1)
+        regions = RegionSet.from_random(nregions, bounds, sizepc=sizepcr, precision=1, seed=0)
 
-        self.regions[name] = regions
-        self.subsets[name] = {}
+        cls.regions[name] = regions
+        cls.subsets[name] = {}
 
         for subsetpc in [0.01, 0.05, 0.1, 0.15, 0.2]:
           size = round(subsetpc * len(regions))
           if 0 < size < len(regions):
             subname = f'{subsetpc:.2f}'
-            shuffled = regions.shuffle()
-            self.subsets[name][subname] = [r.id for i, r in enumerate(shuffled) if i < size]
+            shuffled = regions.shuffle(random)
+            cls.subsets[name][subname] = [r.id for i, r in enumerate(shuffled) if i < size]
 
   def run_evaluator(self, name: str, subname: str, 
                           context: Union[List[str],Region],
@@ -116,8 +120,10 @@ class TestRQEnumerate(TestCase):
 
   def test_srqenum_results(self):
 
+    random = Random(0).random
+
     for name in self.regions.keys():
-      shuffled = self.regions[name].shuffle()
+      shuffled = self.regions[name].shuffle(random)
 
       for region in shuffled[0:ceil(0.01 * len(shuffled))]:
         r = region.id
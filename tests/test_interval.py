@@ -23,8 +23,6 @@ from dataclasses import asdict, astuple
 from typing import List
 from unittest import TestCase
 
-from numpy import mean
-
 from slig.datastructs import Interval
 
 
@@ -69,7 +67,7 @@ class TestInterval(TestCase):
     for interval in self.test_intervals:
       #print(f'{interval}: length={interval.length} midpoint={interval.midpoint}')
       self.assertEqual(interval.length, interval.upper - interval.lower)
-      self.assertEqual(interval.midpoint, mean([interval.lower, interval.upper]))
+      self.assertEqual(interval.midpoint, (interval.lower + interval.upper) / 2)
 
   def test_interval_conversion(self):
     for interval in self.test_intervals:
@@ -8,10 +8,10 @@ Unit tests for Region Data Class
 
 from dataclasses import asdict, astuple
 from functools import reduce
+from operator import mul
 from typing import List, Tuple
 from unittest import TestCase
 
-from numpy import mean
 from pprint import pprint
 
 from slig.datastructs import Interval, Region
@@ -22,14 +22,15 @@ class TestRegion(TestCase):
   test_regions: List[Region]
   overlaps: List[List[bool]]
 
-  def setUp(self):
-    self.test_regions = []
-    self.test_regions.append(Region([0, 0], [5, 5]))
-    self.test_regions.append(Region([2, 2], [5, 10]))
-    self.test_regions.append(Region([1, 5], [3, 7]))
-    self.test_regions.append(Region([-5, 5], [1, 7]))
-    self.test_regions.append(Region([-5, 5], [2, 7]))
-    self.overlaps = [
+  @classmethod
+  def setUpClass(cls):
+    cls.test_regions = []
+    cls.test_regions.append(Region([0, 0], [5, 5]))
+    cls.test_regions.append(Region([2, 2], [5, 10]))
+    cls.test_regions.append(Region([1, 5], [3, 7]))
+    cls.test_regions.append(Region([-5, 5], [1, 7]))
+    cls.test_regions.append(Region([-5, 5], [2, 7]))
+    cls.overlaps = [
       [True,  True,  False, False, False], #  [0, 0], [5, 5]
       [True,  True,  True,  False, False], #  [2, 2], [5, 10]
       [False, True,  True,  False, True],  #  [1, 5], [3, 7]
@@ -42,6 +43,7 @@ class TestRegion(TestCase):
     test_regions.append(Region([0], [5]))
     test_regions.append(Region([0, 0], [5, 5]))
     test_regions.append(Region([0, 5, 0], [5, 0, 5]))
+    interval = Interval(0, 5)
 
     for i, region in enumerate(test_regions):
       #print(region)
@@ -49,10 +51,10 @@ class TestRegion(TestCase):
       self.assertEqual(region.dimension, len(region.factors))
       self.assertEqual(region.dimension, len(region.lower))
       self.assertEqual(region.dimension, len(region.upper))
-      self.assertTrue(all([d == Interval(0,5) for d in region.factors]))
+      self.assertTrue(all([d == interval for d in region.factors]))
       self.assertTrue(all([d == 0 for d in region.lower]))
       self.assertTrue(all([d == 5 for d in region.upper]))
-      self.assertTrue(all([region.lower[i] <= region.upper[i] for i in range(region.dimension)]))
+      self.assertTrue(all(lower <= upper for lower, upper in zip(region.lower, region.upper)))
       self.assertTrue(all([region.lower[i] == region[i].lower for i in range(region.dimension)]))
       self.assertTrue(all([region.upper[i] == region[i].upper for i in range(region.dimension)]))
 
@@ -71,8 +73,8 @@ class TestRegion(TestCase):
       #]))
       self.assertEqual(region.factors, [Interval(region.lower[i], region.upper[i]) for i in range(region.dimension)])
       self.assertEqual(region.lengths, [d.upper - d.lower for d in region.factors])
-      self.assertEqual(region.midpoint, [mean([d.lower, d.upper]) for d in region.factors])
-      self.assertEqual(region.size, reduce(lambda x, y: x*y, region.lengths))
+      self.assertEqual(region.midpoint, [(d.lower + d.upper) / 2 for d in region.factors])
+      self.assertEqual(region.size, reduce(mul, region.lengths))
 
   def test_region_getsetitem(self):
     data = {'data': 'value', 'datalist': ['list', 'of', 'items'], 'dataprop': 'dataprop'}
@@ -132,9 +134,10 @@ class TestRegion(TestCase):
     test_regions.append(Region([-6, 5], [0, 10]))
     test_regions.append(Region([-2, 7], [-2, 7]))
 
+    lower, upper = region.lower, region.upper
     for subregion in test_regions:
-      comparsion = all([region.lower[i] <= subregion.lower[i] <= subregion.upper[i] <= region.upper[i] for i in
-                        range(region.dimension)])
+      comparsion = all(a <= b <= c <= d for a, b, c, d in
+                       zip(lower, subregion.lower, subregion.upper, upper))
       #print(f'{subregion} in\n{region}:')
       #print(f'  expect={comparsion}')
       #print(f'  actual={subregion in region}')
@@ -151,37 +154,29 @@ class TestRegion(TestCase):
 
     for region in test_regions:
       self.assertNotEqual(region.id, match_region.id)
-      if all([region.lower[i] == match_region.lower[i] and \
-              region.upper[i] == match_region.upper[i] for i in range(match_region.dimension)]):
+      if region.lower == match_region.lower and region.upper == match_region.upper:
         self.assertListEqual(region.lower, match_region.lower)
         self.assertListEqual(region.upper, match_region.upper)
         self.assertEqual(region, match_region)
 
-  def test_region_overlaps(self):
+  def test_region_overlaps_intersect(self):
     for i, first in enumerate(self.test_regions):
       for j, second in enumerate(self.test_regions):
-        overlap = first.is_intersecting(second)
-        #print(f'{first}\n{second}:')
-        #print(f'  expect={self.overlaps[i][j]}')
-        #print(f'  actual={overlap}')
-        self.assertEqual(overlap, self.overlaps[i][j])
-
-  def test_region_intersect(self):
-    for i, first in enumerate(self.test_regions):
-      for j, second in enumerate(self.test_regions):
-        intersect = first.get_intersection(second)
-        if self.overlaps[i][j]:
-          #print(f'{first}\n{second}:')
-          #print(f'  actual={intersect}')
-          #print(f'  size={intersect.size}')
-          for x, d in enumerate(first.factors):
-            self.assertEqual(d.get_intersection(second.factors[x]),
-                             intersect.factors[x])
-        else:
+        with self.subTest(i=i, j=j):
+          overlap = first.is_intersecting(second)
+          intersect = first.get_intersection(second)
           #print(f'{first}\n{second}:')
-          #print(f'  expect=None')
-          #print(f'  actual={intersect}')
-          self.assertEqual(intersect, None)
+          #print(f'  expect={self.overlaps[i][j]}')
+          #print(f'  actual={overlap}')
+          self.assertEqual(overlap, self.overlaps[i][j])
+          if overlap:
+            #print(f'  intersect={intersect}')
+            #print(f'  size={intersect.size}')
+            for x, d in enumerate(first.factors):
+              self.assertEqual(d.get_intersection(second.factors[x]),
+                               intersect.factors[x])
+          else:
+            self.assertIsNone(intersect)
 
   # def test_region_union_size(self):
   #   base_region = Region([0]*2, [1]*2)